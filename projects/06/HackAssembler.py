@@ -10,8 +10,71 @@ python hack_assembler.py path/to/in.asm path/to/out.hack
 
 """
 
+import re
 import sys
 
+from array import array
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+
+# Matches a comment to the end of its line.
+COMMENT_RE = re.compile(r'//[^\n]*')
+
+# Deletes all whitespace other than newlines in one C-level pass.
+WHITESPACE_TABLE = str.maketrans('', '', ' \t\r')
+
+# Maps each C instruction dest mnemonic to its (pre-shifted) d-bits.
+DEST_BITS = {dest: i << 3 for i, dest in enumerate((
+    'null', 'M',  'D',  'MD',
+    'A',    'AM', 'AD', 'AMD',
+))}
+
+# Maps each C instruction jump mnemonic to its j-bits.
+JUMP_BITS = {jump: i for i, jump in enumerate((
+    'null', 'JGT', 'JEQ', 'JGE',
+    'JLT',  'JNE', 'JLE', 'JMP',
+))}
+
+# Maps each C instruction computation mnemonic to its c-bits.
+C_BIT_TABLE = {
+    '0': 0b101010, '1': 0b111111, '-1': 0b111010, 'D': 0b001100,
+    'A': 0b110000, 'M': 0b110000, '!D': 0b001101, '!A': 0b110001,
+    '!M': 0b110001, '-D': 0b001111, '-A': 0b110011, '-M': 0b110011,
+    'D+1': 0b011111, 'A+1': 0b110111, 'M+1': 0b110111, 'D-1': 0b001110,
+    'A-1': 0b110010, 'M-1': 0b110010, 'D+A': 0b000010, 'D+M': 0b000010,
+    'D-A': 0b010011, 'D-M': 0b010011, 'A-D': 0b000111, 'M-D': 0b000111,
+    'D&A': 0b000000, 'D&M': 0b000000, 'D|A': 0b010101, 'D|M': 0b010101,
+}
+
+# Computations that read memory and therefore set the a-bit.
+A_BIT_SET = frozenset(comp for comp in C_BIT_TABLE if 'M' in comp)
+
+
+def BuildCInstructionCache():
+  """Pre-encode every valid C instruction permutation.
+
+  The space is small (8 dests x 28 comps x 8 jumps), so the whole
+  instruction set fits in one dict mapping mnemonic to its 16-bit encoding.
+  """
+  cache = {}
+  dests = [('', 0)] + [(dest + '=', bits)
+                       for dest, bits in DEST_BITS.items() if dest != 'null']
+  jumps = [('', 0)] + [(';' + jump, bits)
+                       for jump, bits in JUMP_BITS.items() if jump != 'null']
+  for comp, c_bits in C_BIT_TABLE.items():
+    base = 57344 + (c_bits << 6)
+    if comp in A_BIT_SET:
+      base += 4096  # Set a-bit
+    for dest, d_bits in dests:
+      for jump, j_bits in jumps:
+        cache[dest + comp + jump] = base + d_bits + j_bits
+  return cache
+
+
+# Maps every valid C instruction to its encoding, built once at import time.
+C_INSTR_CACHE = BuildCInstructionCache()
+
 
 class InvalidInputError(Exception):
   """Custom exception type for when users input invalid command line arguments."""
@@ -33,34 +96,27 @@ def ParseArguments():
   return inp_path, outp_path
 
 
-def RemoveComment(line):
-  """Remove a comment from a line of ASM code."""
-  try:
-    return line[:line.index('//')]
-  except ValueError:
-    return line
-
-
 def PreprocessInput(file_content):
-  """Split the .asm content by line and remove all whitespace."""
-  result = []
-  for line in file_content.split('\n'):
-    line = RemoveComment(''.join(line.strip().split()))
-    if line:
-      result.append(line)
-  return result
+  """Split the .asm content by line and remove all comments and whitespace."""
+  return [line
+          for line in COMMENT_RE.sub(
+              '', file_content.translate(WHITESPACE_TABLE)).split('\n')
+          if line]
 
 
 class Assembler:
   """Class that handles parsing the input .asm file and generate the content of the .hack file."""
   
-  def __init__(self, inp_path, outp_path):
-    self.inp_path_ = inp_path
-    self.outp_path_ = outp_path
-    with open(self.inp_path_) as f:
-      self.asm_content_ = PreprocessInput(f.read())
-    self.cur_line_ = None
-    self.symbols_ = {'R' + str(i): i for i in range(16)}
+  def __init__(self, inp_path: str, outp_path: str):
+    # The attribute annotations let an ahead-of-time compiler such as mypyc
+    # unbox the int arithmetic and skip dict lookups on self.
+    self.inp_path_: str = inp_path
+    self.outp_path_: str = outp_path
+    # read_text stats the file first and reads it in one sized buffer.
+    self.asm_content_: List[str] = PreprocessInput(
+        Path(self.inp_path_).read_text())
+    self.cur_line_: Optional[str] = None
+    self.symbols_: Dict[str, int] = {'R' + str(i): i for i in range(16)}
     self.symbols_.update({
         'SCREEN': 16384,
         'KBD': 24576,
@@ -70,61 +126,69 @@ class Assembler:
         'THIS': 3,
         'THAT': 4,
     })
-    self.labels_ = set()
-    self.var_addr_ = 16
-    self.output_ = []
-    self.c_bit_table_ = {
-        '0': 0b101010, '1': 0b111111, '-1': 0b111010, 'D': 0b001100,
-        'A': 0b110000, 'M': 0b110000, '!D': 0b001101, '!A': 0b110001,
-        '!M': 0b110001, '-D': 0b001111, '-A': 0b110011, '-M': 0b110011,
-        'D+1': 0b011111, 'A+1': 0b110111, 'M+1': 0b110111, 'D-1': 0b001110,
-        'A-1': 0b110010, 'M-1': 0b110010, 'D+A': 0b000010, 'D+M': 0b000010,
-        'D-A': 0b010011, 'D-M': 0b010011, 'A-D': 0b000111, 'M-D': 0b000111,
-        'D&A': 0b000000, 'D&M': 0b000000, 'D|A': 0b010101, 'D|M': 0b010101,
-    }
-
-  def FirstPass(self):
-    """First pass searches for labels and stores their address."""
-    n = 0
-    for i, line in enumerate(self.asm_content_):
-      if line[0] != '(':
-        n += 1
+    self.var_addr_: int = 16
+    # Unsigned 16-bit array; each instruction costs 2 bytes instead of a
+    # full Python int object.
+    self.output_: array = array('H')
+    # Holds (output index, symbol) pairs for symbols that were not yet
+    # defined when their A instruction was processed.
+    self.pending_: List[Tuple[int, str]] = []
+
+  def Process(self):
+    """Translate the assembly in a single pass over the input.
+
+    A instructions that reference a symbol which is not defined yet emit a
+    placeholder and are patched once every label has been seen.
+    """
+    for line in self.asm_content_:
+      if line[0] == '(':
+        symbol = line[1:-1]
+        if symbol in self.symbols_:
+          raise SyntaxError(
+              'Cannot overwrite a predefined symbol \'{}\' with a '
+              'label'.format(symbol))
+        self.symbols_[symbol] = len(self.output_)
         continue
-      self.labels_.add(i)
-      symbol = line[1:-1]
-      if symbol in self.symbols_:
-        raise SyntaxError(
-            'Cannot overwrite a predefined symbol \'{}\' with a '
-            'label'.format(symbol))
-      self.symbols_[symbol] = n
-
-  def SecondPass(self):
-    """Process the symbols in all lines that aren't labels."""
-    for i, line in enumerate(self.asm_content_):
       self.cur_line_ = line
-      if i in self.labels_:
-        continue
       if self.cur_line_[0] == '@':
         self.ProcessA_()
       else:
         self.ProcessC_()
+    self.ResolvePending_()
 
   def ProcessA_(self):
     """Process an A instruction."""
     addr = self.cur_line_[1:]
     try:
       addr = int(addr)
-      self.output_.append(addr % (1 << 16))
+      self.output_.append(addr & 0xFFFF)
     except ValueError:
       if addr in self.symbols_:
         self.output_.append(self.symbols_[addr])
         return
-      self.symbols_[addr] = self.var_addr_
-      self.output_.append(self.var_addr_ % (1 << 16))
-      self.var_addr_ += 1
+      self.pending_.append((len(self.output_), addr))
+      self.output_.append(0)
+
+  def ResolvePending_(self):
+    """Resolve the A instructions that referenced a yet-undefined symbol.
+
+    Symbols that were never defined by a label are variables; they get
+    addresses in order of first use, matching a two-pass assembler.
+    """
+    for i, symbol in self.pending_:
+      if symbol not in self.symbols_:
+        self.symbols_[symbol] = self.var_addr_
+        self.var_addr_ += 1
+      self.output_[i] = self.symbols_[symbol] & 0xFFFF
 
   def ProcessC_(self):
     """Process a C instruction."""
+    encoded = C_INSTR_CACHE.get(self.cur_line_)
+    if encoded is not None:
+      self.output_.append(encoded)
+      return
+    # Fall back to parsing the instruction field by field. Only malformed
+    # input reaches this path; it keeps the original error behavior.
     result = 57344  # Set first 3 most significant bits.
     try:
       i = self.cur_line_.index(';')
@@ -138,42 +202,27 @@ class Assembler:
     except ValueError:
       dest, comp = '', computation
     if dest:
-      d_bits = [
-          'null', 'M',  'D',  'MD',
-          'A',    'AM', 'AD', 'AMD',
-      ].index(dest) << 3
-      result += d_bits
-
-    c_bits = self.c_bit_table_[comp] << 6
-    result += c_bits
-    if 'M' in comp:
+      result += DEST_BITS[dest]
+
+    result += C_BIT_TABLE[comp] << 6
+    if comp in A_BIT_SET:
       result += 4096  # Set a-bit
 
     if jump:
-      j_bits = [
-          'null', 'JGT', 'JEQ', 'JGE',
-          'JLT',  'JNE', 'JLE', 'JMP',
-      ].index(jump)
-      result += j_bits
+      result += JUMP_BITS[jump]
 
     self.output_.append(result)
 
   def WriteOutput(self):
     """Write the output of the translation to the .hack file."""
-    output_tmp = []
-    for x in self.output_:
-      x = '{0:b}'.format(x)
-      x = '0' * (16 - len(x)) + x
-      output_tmp.append(x)
     with open(self.outp_path_, 'w') as f:
-      f.write('\n'.join(output_tmp))
+      f.write('\n'.join(format(x, '016b') for x in self.output_))
 
 
 def main():
   """Main entry point, instantiates Assembler class and calls methods."""
   assembler = Assembler(*ParseArguments())
-  assembler.FirstPass()
-  assembler.SecondPass()
+  assembler.Process()
   assembler.WriteOutput()
 
 
@@ -0,0 +1,23 @@
+"""
+Optional Cython build for the Hack Assembler.
+
+The assembler is plain Python and runs without this file. Building it with
+Cython in pure-python mode compiles the per-instruction hot path
+(Assembler.SecondPass/ProcessC_) to a C extension, which removes the
+bytecode dispatch overhead on the string and dict operations there.
+
+Example usage:
+
+python setup.py build_ext --inplace
+
+"""
+
+from setuptools import setup
+
+from Cython.Build import cythonize
+
+
+setup(
+    name='HackAssembler',
+    ext_modules=cythonize('HackAssembler.py', language_level=3),
+)
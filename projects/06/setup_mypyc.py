@@ -0,0 +1,23 @@
+"""
+Optional mypyc build for the Hack Assembler.
+
+Alternative to the Cython build in setup.py. mypyc compiles the annotated
+Assembler class to a C extension directly from the type annotations, with
+unboxed int arithmetic in ProcessC_; no separate source dialect is needed.
+The plain .py keeps working if the extension is not built.
+
+Example usage:
+
+python setup_mypyc.py build_ext --inplace
+
+"""
+
+from setuptools import setup
+
+from mypyc.build import mypycify
+
+
+setup(
+    name='HackAssembler',
+    ext_modules=mypycify(['HackAssembler.py']),
+)
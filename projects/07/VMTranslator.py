@@ -10,15 +10,28 @@ partially supports the VM language. It supports:
 - Stack arithmetic operations: add, sub, neg, not, and, or, lt, gt
 - Memory segments
 
+Multiple .vm files can be translated in one invocation, which keeps a
+single long-lived process for the whole batch. This is especially useful
+under PyPy, whose tracing JIT only pays off once the translation loop has
+warmed up:
+
+pypy3 VMTranslator.py path/to/*.vm
+
 """
 
 
+import functools
 import os
+import re
 import sys
 
-from typing import List, Tuple
+from pathlib import Path
+from typing import List
 
 
+# Matches a comment to the end of its line.
+COMMENT_RE = re.compile(r'//[^\n]*')
+
 SEGMENT_POINTERS = {
     'local': 'LCL',
     'argument': 'ARG',
@@ -26,41 +39,69 @@ SEGMENT_POINTERS = {
     'that': 'THAT',
 }
 
+# Constant assembly snippets shared by many operations. Hoisted to module-level
+# tuples so each use is a pointer copy instead of a fresh list construction.
+
+# Push the value in the D register onto the stack.
+PUSH_D_TO_STACK = ('@SP', 'A=M', 'M=D', '@SP', 'M=M+1')
+
+# Pop the stack into the D register.
+POP_STACK_TO_D = ('@SP', 'AM=M-1', 'D=M')
+
+# Set the A register to the address at the top of the stack.
+SET_A_TO_STACK_TOP = ('@SP', 'A=M-1')
+
+# Final instruction of each binary stack arithmetic operation. It overwrites
+# the top of the stack with the result.
+BINARY_OP_TAIL = {
+    'add': 'M=M+D',
+    'sub': 'M=M-D',
+    'and': 'M=M&D',
+    'or': 'M=M|D',
+}
+
+# Unary stack arithmetic operations, which negate the top of the stack in place.
+UNARY_OPS = {
+    'neg': 'M=-M',
+    'not': 'M=!M',
+}
+
+# Jump commands used by each conditional operation.
+CONDITIONAL_JUMPS = {
+    'eq': 'JEQ',
+    'lt': 'JLT',
+    'gt': 'JGT',
+}
+
 
 class InvalidInputError(Exception):
   """Custom exception type for when users input invalid command line arguments."""
 
   def __init__(self):
     super(InvalidInputError, self).__init__(
-        'Must be called `python VMTranslator.py path/to/in.vm')
+        'Must be called `python VMTranslator.py path/to/in.vm '
+        '[path/to/other.vm ...]')
 
 
-def ParseArguments() -> Tuple[str]:
-  """Parse command line arguments and return the input and output file paths."""
-  if len(sys.argv) != 2:
+def ParseArguments() -> List[str]:
+  """Parse command line arguments and return the input file paths."""
+  if len(sys.argv) < 2:
     raise InvalidInputError()
-  inp_path = sys.argv[1]
-  if not inp_path.endswith('.vm'):
+  inp_paths = sys.argv[1:]
+  if not all(inp_path.endswith('.vm') for inp_path in inp_paths):
     raise InvalidInputError()
-  outp_path = inp_path.replace('.vm', '.asm')
-  return inp_path, outp_path
-
-
-def RemoveComment(line: str) -> str:
-  """Strip a comment from a line of ASM code."""
-  try:
-    return line[:line.index('//')]
-  except ValueError:
-    return line
+  return inp_paths
 
 
 def PreprocessInput(file_content: str) -> List[List[str]]:
   """Split the .vm content by line, each line into tokens, and remove all comments."""
   result = []
-  for line in file_content.split('\n'):
-    line = RemoveComment(line.strip())
-    if line:
-      result.append(line.split())
+  for line in COMMENT_RE.sub('', file_content).split('\n'):
+    tokens = line.split()
+    if tokens:
+      # Interning makes the op/segment strings share storage across lines
+      # and lets the dispatch dict reuse their cached hashes.
+      result.append([sys.intern(token) for token in tokens])
   return result
 
 
@@ -70,148 +111,171 @@ def FileLabel(input_path):
   return fname[:-3]
 
 
-def TranslateVMtoASM(vm_tokens: List[List[str]], file_label) -> str:
-  """Translate tokens in the VM file into Hack Assembly."""
-  result = []
+def TranslateVMtoASM(vm_tokens: List[List[str]], file_label, write):
+  """Translate tokens in the VM file into Hack Assembly.
+
+  Each operation's assembly is flushed through the provided write callable,
+  so peak memory stays bounded by one operation's worth of lines no matter
+  how large the VM file is.
+  """
+  buffer = []
   counter = 0
   for tokens in vm_tokens:
-    op = tokens[0]
-    if op == 'push':
-      segment = tokens[1]
-      offset = int(tokens[2])
-      result.extend(LoadValueToD(segment, offset, file_label))
-      result.extend(PushDRegisterToStack())
-    elif op == 'pop':
-      segment = tokens[1]
-      offset = int(tokens[2])
-      result.extend(LoadAddressIntoR15(segment, offset, file_label))
-      result.extend(PopStackToDRegister())
-      # R15 contains the address to save the value in the D register.
-      result.extend(['@R15', 'A=M', 'M=D'])
-    elif op in ['add', 'sub', 'and', 'or']:
-      result.extend(BinaryOperation(op))
-    elif op in ['neg', 'not']:
-      result.extend(SetARegisterToTopOfStack())
-      result.append('M=-M' if op == 'neg' else 'M=!M')
-    elif op in ['eq', 'lt', 'gt']:
-      result.extend(Conditional(op, counter))
-      counter += 1
-    else:
-      raise SyntaxError('Unexpected operation: {}'.format(op))
-  result.append('')
-  return '\n'.join(result)
-
-
-def LoadValueToD(segment: str, offset: int, file_label: str) -> List[str]:
-  """Load a value from the pointer specified by (segment, offset) into the D register."""
-  if segment == 'constant':
-    return ['@{}'.format(offset), 'D=A']
-  if segment == 'temp':
-    return ['@{}'.format(5 + offset), 'D=M']
-  if segment in SEGMENT_POINTERS:
-    return [
-        '@{}'.format(SEGMENT_POINTERS[segment]),
-        'D=M',
-        '@{}'.format(offset),
-        'A=A+D',
-        'D=M',
-    ]
-  if segment == 'static':
-    return [
-        '@{}.{}'.format(file_label, offset),
-        'D=M',
-    ]
-  if segment != 'pointer':
-    raise SyntaxError('Unexpected segment: {}'.format(segment))
-  return [
-      '@{}'.format('THAT' if offset else 'THIS'),
-      'D=M',
-  ]
-
-
-def PushDRegisterToStack() -> List[str]:
-  """Push value in the D register onto the stack."""
-  return ['@SP', 'A=M', 'M=D', '@SP', 'M=M+1']
-
-
-def LoadAddressIntoR15(segment: str, offset: int, file_label: str) -> List[str]:
-  """Load the address of the pointer determined by (segment, offset) into RAM[15]."""
-  result = []
-  if segment == 'temp':
-    result = ['@{}'.format(5 + offset), 'D=A']
-  elif segment in SEGMENT_POINTERS:
-    result = [
-        '@{}'.format(SEGMENT_POINTERS[segment]),
-        'D=M',
-        '@{}'.format(offset),
-        'D=D+A',
-    ]
-  elif segment == 'static':
-    result = [
-        '@{}.{}'.format(file_label, offset),
-        'D=A',
-    ]
-  elif segment == 'pointer':
-    result = [
-        '@{}'.format('THAT' if offset else 'THIS'),
-        'D=A',
-    ]
-  else:
-    raise SyntaxError('Unexpected segment: {}'.format(segment))
-  result.extend(['@R15', 'M=D'])
-  return result
-
-
-def BinaryOperation(op: str) -> List[str]:
-  """Binary stack arithmetic operation implementation."""
-  result = []
-  result.extend(PopStackToDRegister())
-  # Overwrite the top of the stack with the result.
-  result.extend(SetARegisterToTopOfStack())
-  if op == 'add':
-    result.append('M=M+D')
-  elif op == 'sub':
-    result.append('M=M-D')
-  elif op == 'and':
-    result.append('M=M&D')
-  else:  # op == or
-    result.append('M=M|D')
-  return result
+    try:
+      handler = OP_HANDLERS[tokens[0]]
+    except KeyError:
+      raise SyntaxError('Unexpected operation: {}'.format(tokens[0]))
+    counter = handler(tokens, buffer, file_label, counter)
+    buffer.append('')
+    write('\n'.join(buffer))
+    del buffer[:]
+
+
+def TranslatePush(tokens: List[str], result: List[str], file_label: str,
+                  counter: int) -> int:
+  """Translate a stack push operation into assembly code."""
+  try:
+    emit = PUSH_EMITTERS[tokens[1]]
+  except KeyError:
+    raise SyntaxError('Unexpected segment: {}'.format(tokens[1]))
+  result.append(emit(int(tokens[2]), file_label))
+  return counter
 
 
-def PopStackToDRegister() -> List[str]:
-  """Pop the stack into the D register."""
-  return ['@SP', 'AM=M-1', 'D=M']
+def TranslatePop(tokens: List[str], result: List[str], file_label: str,
+                 counter: int) -> int:
+  """Translate a stack pop operation into assembly code."""
+  try:
+    emit = POP_EMITTERS[tokens[1]]
+  except KeyError:
+    raise SyntaxError('Unexpected segment: {}'.format(tokens[1]))
+  result.append(emit(int(tokens[2]), file_label))
+  return counter
 
 
-def SetARegisterToTopOfStack() -> List[str]:
-  """Set the A register to the address at the top of the stack."""
-  return ['@SP', 'A=M-1']
+def TranslateBinaryOperation(tokens: List[str], result: List[str],
+                             file_label: str, counter: int) -> int:
+  """Translate a binary stack arithmetic operation into assembly code."""
+  result.extend(POP_STACK_TO_D)
+  # Overwrite the top of the stack with the result.
+  result.extend(SET_A_TO_STACK_TOP)
+  result.append(BINARY_OP_TAIL[tokens[0]])
+  return counter
+
+
+def TranslateUnaryOperation(tokens: List[str], result: List[str],
+                            file_label: str, counter: int) -> int:
+  """Translate a unary stack arithmetic operation into assembly code."""
+  result.extend(SET_A_TO_STACK_TOP)
+  result.append(UNARY_OPS[tokens[0]])
+  return counter
+
+
+def TranslateConditional(tokens: List[str], result: List[str], file_label: str,
+                         counter: int) -> int:
+  """Translate a conditional operation into assembly code."""
+  result.extend(Conditional(tokens[0], counter))
+  return counter + 1
+
+
+def BuildPushEmitters():
+  """Build one specialized push emitter per memory segment.
+
+  The constant parts of each segment's assembly are folded into a single
+  format string once at import time, so emitting a push is one format call
+  with no per-call branching on the segment. Each emitter is memoized since
+  typical VM files reuse the same (segment, offset) pairs many times.
+  """
+  suffix = '\n'.join(PUSH_D_TO_STACK)
+
+  def Constant(offset, file_label, template='@{}\nD=A\n' + suffix):
+    return template.format(offset)
+
+  def Temp(offset, file_label, template='@{}\nD=M\n' + suffix):
+    return template.format(5 + offset)
+
+  def Static(offset, file_label, template='@{}.{}\nD=M\n' + suffix):
+    return template.format(file_label, offset)
+
+  def Pointer(offset, file_label,
+              this='@THIS\nD=M\n' + suffix,
+              that='@THAT\nD=M\n' + suffix):
+    return that if offset else this
+
+  emitters = {
+      'constant': Constant,
+      'temp': Temp,
+      'static': Static,
+      'pointer': Pointer,
+  }
+  for segment, pointer in SEGMENT_POINTERS.items():
+    def FromSegmentPointer(
+        offset, file_label,
+        template='@' + pointer + '\nD=M\n@{}\nA=A+D\nD=M\n' + suffix):
+      return template.format(offset)
+    emitters[segment] = FromSegmentPointer
+  return {segment: functools.lru_cache(maxsize=None)(emitter)
+          for segment, emitter in emitters.items()}
+
+
+def BuildPopEmitters():
+  """Build one specialized pop emitter per memory segment.
+
+  Built the same way as BuildPushEmitters; each emitter computes the target
+  address into R15, pops the stack into D, and stores D at the address.
+  """
+  suffix = ('\n@R15\nM=D\n' + '\n'.join(POP_STACK_TO_D)
+            + '\n@R15\nA=M\nM=D')
+
+  def Temp(offset, file_label, template='@{}\nD=A' + suffix):
+    return template.format(5 + offset)
+
+  def Static(offset, file_label, template='@{}.{}\nD=A' + suffix):
+    return template.format(file_label, offset)
+
+  def Pointer(offset, file_label,
+              this='@THIS\nD=A' + suffix,
+              that='@THAT\nD=A' + suffix):
+    return that if offset else this
+
+  emitters = {
+      'temp': Temp,
+      'static': Static,
+      'pointer': Pointer,
+  }
+  for segment, pointer in SEGMENT_POINTERS.items():
+    def FromSegmentPointer(
+        offset, file_label,
+        template='@' + pointer + '\nD=M\n@{}\nD=D+A' + suffix):
+      return template.format(offset)
+    emitters[segment] = FromSegmentPointer
+  return {segment: functools.lru_cache(maxsize=None)(emitter)
+          for segment, emitter in emitters.items()}
+
+
+# Specialized per-segment emitters for push/pop, built once at import time.
+PUSH_EMITTERS = BuildPushEmitters()
+POP_EMITTERS = BuildPopEmitters()
 
 
 def Conditional(op: str, index: int) -> List[str]:
   """Implements a conditional operation on the stack (eq, lt, gt)"""
-  if op == 'eq':
-    jump_cmd = 'JEQ'
-  elif op == 'lt':
-    jump_cmd = 'JLT'
-  else:  # op == gt
-    jump_cmd = 'JGT'
-  result = PopStackToDRegister()
-  result.extend(SetARegisterToTopOfStack())
+  jump_cmd = CONDITIONAL_JUMPS[op]
+  result = list(POP_STACK_TO_D)
+  result.extend(SET_A_TO_STACK_TOP)
   result.extend([
       'D=M-D',
       '@InsertTrue.{}'.format(index),
       'D;{}'.format(jump_cmd),
   ])
-  result.extend(SetARegisterToTopOfStack())
+  result.extend(SET_A_TO_STACK_TOP)
   result.extend([
       'M=0',
       '@End.{}'.format(index),
       '0;JMP',
       '(InsertTrue.{})'.format(index),
   ])
-  result.extend(SetARegisterToTopOfStack())
+  result.extend(SET_A_TO_STACK_TOP)
   result.extend([
       'M=-1',
       '(End.{})'.format(index),
@@ -219,13 +283,29 @@ def Conditional(op: str, index: int) -> List[str]:
   return result
 
 
+# Maps each VM operation to the handler that translates it to assembly code.
+OP_HANDLERS = {
+    'push': TranslatePush,
+    'pop': TranslatePop,
+    'add': TranslateBinaryOperation,
+    'sub': TranslateBinaryOperation,
+    'and': TranslateBinaryOperation,
+    'or': TranslateBinaryOperation,
+    'neg': TranslateUnaryOperation,
+    'not': TranslateUnaryOperation,
+    'eq': TranslateConditional,
+    'lt': TranslateConditional,
+    'gt': TranslateConditional,
+}
+
+
 def main():
-  """Main function parses the arguments, translate VM code to assembly, and write the output."""
-  inp_path, outp_path = ParseArguments()
-  with open(inp_path, 'r') as f:
-    asm_content = TranslateVMtoASM(PreprocessInput(f.read()), FileLabel(inp_path))
-  with open(outp_path, 'w') as f:
-    f.write(asm_content)
+  """Main function parses the arguments, translates each VM file to assembly, and writes the outputs."""
+  for inp_path in ParseArguments():
+    outp_path = inp_path.replace('.vm', '.asm')
+    vm_tokens = PreprocessInput(Path(inp_path).read_text())
+    with open(outp_path, 'w', buffering=1 << 16) as f:
+      TranslateVMtoASM(vm_tokens, FileLabel(inp_path), f.write)
 
 
 if __name__ == '__main__':
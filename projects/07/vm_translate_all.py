@@ -0,0 +1,58 @@
+"""
+Parallel VM Translator driver
+-----------------------------
+Translates every .vm file in a directory to Hack assembly, fanning the
+files out over a multiprocessing.Pool. Each file is independent, so the
+work is embarrassingly parallel and scales with the core count.
+
+Example usage:
+
+python vm_translate_all.py path/to/project/dir
+
+"""
+
+
+import os
+import sys
+
+from multiprocessing import Pool
+from pathlib import Path
+
+from VMTranslator import FileLabel, PreprocessInput, TranslateVMtoASM
+
+
+class InvalidInputError(Exception):
+  """Custom exception type for when users input invalid command line arguments."""
+
+  def __init__(self):
+    super(InvalidInputError, self).__init__(
+        'Must be called `python vm_translate_all.py path/to/dir`')
+
+
+def ParseArguments() -> str:
+  """Parse command line arguments and return the input directory path."""
+  if len(sys.argv) != 2 or not os.path.isdir(sys.argv[1]):
+    raise InvalidInputError()
+  return sys.argv[1]
+
+
+def TranslateOne(inp_path: str):
+  """Translate a single .vm file, reproducing VMTranslator's main for one path."""
+  outp_path = inp_path.replace('.vm', '.asm')
+  vm_tokens = PreprocessInput(Path(inp_path).read_text())
+  with open(outp_path, 'w', buffering=1 << 16) as f:
+    TranslateVMtoASM(vm_tokens, FileLabel(inp_path), f.write)
+
+
+def main():
+  """Main function collects the .vm files and translates them in parallel."""
+  dir_path = ParseArguments()
+  inp_paths = sorted(str(path) for path in Path(dir_path).glob('*.vm'))
+  if not inp_paths:
+    raise InvalidInputError()
+  with Pool() as pool:
+    pool.map(TranslateOne, inp_paths)
+
+
+if __name__ == '__main__':
+  main()
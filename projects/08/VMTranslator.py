@@ -15,12 +15,19 @@ specified in the Nand2Tetris course, which includes:
 """
 
 
+import functools
+import mmap
 import os
+import re
 import sys
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List
 
 
+# Matches a comment to the end of its line.
+COMMENT_RE = re.compile(r'//[^\n]*')
+
 SEGMENT_POINTERS = {
     'local': 'LCL',
     'argument': 'ARG',
@@ -37,6 +44,44 @@ LCL_TMP_REGISTER = 'R13'
 # after a function returns in case the called function had no arguments.
 RETURN_ADDR_TMP_REGISTER = 'R14'
 
+# Constant assembly snippets shared by many operations. Hoisted to module-level
+# tuples so each use extends from one shared object instead of rebuilding the
+# same strings; tuples also iterate in C during extend.
+
+# Push the value in the D register onto the stack.
+PUSH_D_TO_STACK = ('@SP', 'A=M', 'M=D', '@SP', 'M=M+1')
+
+# Pop the stack into the D register.
+POP_STACK_TO_D = ('@SP', 'AM=M-1', 'D=M')
+
+# Set the A register to the address at the top of the stack.
+SET_A_TO_STACK_TOP = ('@SP', 'A=M-1')
+
+# Push the constant 0 onto the stack; FunctionOp emits this once per local.
+PUSH_CONST_ZERO = ('@0', 'D=A') + PUSH_D_TO_STACK
+
+# Push the value of each segment pointer onto the stack; CallOp saves all
+# four when building a stack frame.
+PUSH_POINTER = {name: ('@' + name, 'D=M') + PUSH_D_TO_STACK
+                for name in ('LCL', 'ARG', 'THIS', 'THAT')}
+
+# Jump commands used by each comparison operation.
+COMPARISON_JUMPS = {
+    'eq': 'JEQ',
+    'lt': 'JLT',
+    'gt': 'JGT',
+}
+
+
+@functools.lru_cache(maxsize=1024)
+def At(value) -> str:
+  """Return the (interned) A instruction for an address or symbol.
+
+  The same small offsets and pointer names recur thousands of times in a
+  big VM project; caching folds every duplicate to one shared string.
+  """
+  return sys.intern('@{}'.format(value))
+
 
 class InvalidInputError(Exception):
   """Custom exception type for when users input invalid command line arguments."""
@@ -68,8 +113,11 @@ def ParseIOPathsFromArguments() -> List[str]:
 
 def ParseIOPathsFromDir(dir_path: str) -> List[str]:
   """Parse the input paths to the VM files in a directory."""
-  vm_filenames = [fname for fname in os.listdir(dir_path)
-                        if fname.endswith('.vm')]
+  # scandir yields DirEntry objects with the name cached from one syscall
+  # sweep, unlike listdir + per-name stat on some filesystems.
+  with os.scandir(dir_path) as entries:
+    vm_filenames = [entry.name for entry in entries
+                    if entry.is_file() and entry.name.endswith('.vm')]
   if 'Sys.vm' not in vm_filenames:
     raise InvalidInputError('Directory must contain a Sys.vm file')
   result = [os.path.join(dir_path, fname) for fname in vm_filenames]
@@ -79,72 +127,152 @@ def ParseIOPathsFromDir(dir_path: str) -> List[str]:
   return result
 
 
-def TranslateVMFiletoASM(vm_file_path: str, call_counts: Dict[str, int]) -> List[str]:
+def ReadVMFile(vm_file_path: str) -> str:
+  """Read the content of a VM file.
+
+  Maps the file instead of read()-ing it: the page cache backs the buffer
+  directly and the only copy made is the final decode to str. Empty files
+  cannot be mapped, so they short-circuit.
+  """
+  with open(vm_file_path, 'rb') as f:
+    if os.fstat(f.fileno()).st_size == 0:
+      return ''
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+      return bytes(mm).decode('utf-8')
+
+
+def TranslateVMFiletoASM(vm_file_path: str, call_counts: Dict[str, int],
+                         vm_file_content: str = None) -> List[str]:
   """Translate the content of a single VM code file into assembly."""
-  with open(vm_file_path, 'r') as f:
-    vm_file_content = f.read()
+  if vm_file_content is None:
+    vm_file_content = ReadVMFile(vm_file_path)
   vm_tokens = PreprocessInput(vm_file_content)
   file_label = FileLabel(vm_file_path)
+  # Every helper appends directly into this one list through its out
+  # parameter, so no temporary per-op lists are built and extended away.
   result = []
   comparison_counter = 0
+  # Local binding: LOAD_FAST in the loop beats a global lookup per op.
+  handlers = OP_HANDLERS
   for tokens in vm_tokens:
-    op = tokens[0]
-    if op in ['push', 'pop']:
-      segment = tokens[1]
-      offset = int(tokens[2])
-      if op == 'push':
-        result.extend(PushOp(segment, offset, file_label))
-      else:  # op == pop
-        result.extend(PopOp(segment, offset, file_label))
-    elif op in ['add', 'sub', 'and', 'or']:
-      result.extend(BinaryOp(op))
-    elif op in ['neg', 'not']:
-      result.extend(UnaryOp(op))
-    elif op in ['eq', 'lt', 'gt']:
-      result.extend(ComparisonOp(op, comparison_counter, file_label))
-      comparison_counter += 1
-    elif op in ['label', 'goto', 'if-goto']:
-      label = tokens[1]
-      if op == 'label':
-        result.extend(LabelOp(file_label, label))
-      elif op == 'goto':
-        result.extend(GotoOp(file_label, label))
-      else:  # op == if-goto
-        result.extend(IfGotoOp(file_label, label))
-    elif op in ['function', 'call']:
-      fn_name = tokens[1]
-      n = int(tokens[2])
-      if op == 'function':
-        result.extend(FunctionOp(fn_name, n, file_label))
-      else:  # op == call
-        try:
-          call_counts[fn_name] += 1
-        except KeyError:
-          call_counts[fn_name] = 0
-        result.extend(CallOp(fn_name, call_counts[fn_name], n))
-    elif op == 'return':
-      result.extend(ReturnOp())
-    else:
-      raise SyntaxError('Unexpected operation: {}'.format(op))
+    try:
+      handler = handlers[tokens[0]]
+    except KeyError:
+      raise SyntaxError('Unexpected operation: {}'.format(tokens[0]))
+    comparison_counter = handler(result, tokens, file_label,
+                                 comparison_counter, call_counts)
   return result
 
 
-def PreprocessInput(file_content: str) -> List[List[str]]:
-  """Split the .vm content by line, each line into tokens, and remove all comments."""
-  result = []
-  for line in file_content.split('\n'):
-    line = RemoveComment(line.strip())
-    if line:
-      result.append(line.split())
-  return result
+def HandlePush(out: List[str], tokens: List[str], file_label: str,
+               comparison_counter: int, call_counts: Dict[str, int]) -> int:
+  PushOp(out, tokens[1], int(tokens[2]), file_label)
+  return comparison_counter
+
+
+def HandlePop(out: List[str], tokens: List[str], file_label: str,
+              comparison_counter: int, call_counts: Dict[str, int]) -> int:
+  PopOp(out, tokens[1], int(tokens[2]), file_label)
+  return comparison_counter
+
+
+def HandleBinary(out: List[str], tokens: List[str], file_label: str,
+                 comparison_counter: int, call_counts: Dict[str, int]) -> int:
+  BinaryOp(out, tokens[0])
+  return comparison_counter
 
 
-def RemoveComment(line: str) -> str:
-  """Strip a comment from a line of ASM code."""
+def HandleUnary(out: List[str], tokens: List[str], file_label: str,
+                comparison_counter: int, call_counts: Dict[str, int]) -> int:
+  UnaryOp(out, tokens[0])
+  return comparison_counter
+
+
+def HandleComparison(out: List[str], tokens: List[str], file_label: str,
+                     comparison_counter: int,
+                     call_counts: Dict[str, int]) -> int:
+  ComparisonOp(out, tokens[0], comparison_counter, file_label)
+  return comparison_counter + 1
+
+
+def HandleLabel(out: List[str], tokens: List[str], file_label: str,
+                comparison_counter: int, call_counts: Dict[str, int]) -> int:
+  LabelOp(out, file_label, tokens[1])
+  return comparison_counter
+
+
+def HandleGoto(out: List[str], tokens: List[str], file_label: str,
+               comparison_counter: int, call_counts: Dict[str, int]) -> int:
+  GotoOp(out, file_label, tokens[1])
+  return comparison_counter
+
+
+def HandleIfGoto(out: List[str], tokens: List[str], file_label: str,
+                 comparison_counter: int, call_counts: Dict[str, int]) -> int:
+  IfGotoOp(out, file_label, tokens[1])
+  return comparison_counter
+
+
+def HandleFunction(out: List[str], tokens: List[str], file_label: str,
+                   comparison_counter: int,
+                   call_counts: Dict[str, int]) -> int:
+  FunctionOp(out, tokens[1], int(tokens[2]), file_label)
+  return comparison_counter
+
+
+def HandleCall(out: List[str], tokens: List[str], file_label: str,
+               comparison_counter: int, call_counts: Dict[str, int]) -> int:
+  fn_name = tokens[1]
   try:
-    return line[:line.index('//')]
-  except ValueError:
-    return line
+    call_counts[fn_name] += 1
+  except KeyError:
+    call_counts[fn_name] = 0
+  CallOp(out, fn_name, call_counts[fn_name], int(tokens[2]))
+  return comparison_counter
+
+
+def HandleReturn(out: List[str], tokens: List[str], file_label: str,
+                 comparison_counter: int, call_counts: Dict[str, int]) -> int:
+  ReturnOp(out)
+  return comparison_counter
+
+
+# Maps each VM operation to the handler that translates it to assembly code.
+# All handlers share one signature and return the comparison counter, so the
+# main loop is a single O(1) dict lookup per op.
+OP_HANDLERS = {
+    'push': HandlePush,
+    'pop': HandlePop,
+    'add': HandleBinary,
+    'sub': HandleBinary,
+    'and': HandleBinary,
+    'or': HandleBinary,
+    'neg': HandleUnary,
+    'not': HandleUnary,
+    'eq': HandleComparison,
+    'lt': HandleComparison,
+    'gt': HandleComparison,
+    'label': HandleLabel,
+    'goto': HandleGoto,
+    'if-goto': HandleIfGoto,
+    'function': HandleFunction,
+    'call': HandleCall,
+    'return': HandleReturn,
+}
+
+
+def PreprocessInput(file_content: str) -> List[List[str]]:
+  """Split the .vm content by line, each line into tokens, and remove all comments.
+
+  One precompiled regex pass strips every comment at once, so the Python
+  loop only splits the surviving lines into tokens.
+  """
+  result = []
+  for line in COMMENT_RE.sub('', file_content).split('\n'):
+    tokens = line.split()
+    if tokens:
+      result.append(tokens)
+  return result
 
 
 def FileLabel(input_path):
@@ -153,189 +281,207 @@ def FileLabel(input_path):
   return fname[:-3]
 
 
-def PushOp(segment: str, offset: int, file_label: str) -> List[str]:
+def PushOp(out: List[str], segment: str, offset: int, file_label: str):
   """Translates a stack push operation into assembly code."""
-  result = LoadValueToD(segment, offset, file_label)
-  result.extend(PushDRegisterToStack())
-  return result
+  LoadValueToD(out, segment, offset, file_label)
+  PushDRegisterToStack(out)
+
+
+def BuildLoadDHandlers():
+  """Build one specialized value loader per memory segment.
+
+  Dispatching through this table replaces the per-push branch cascade on
+  the segment name with a single dict lookup.
+  """
+  def Constant(out, offset, file_label):
+    out.extend((At(offset), 'D=A'))
+
+  def Temp(out, offset, file_label):
+    out.extend((At(5 + offset), 'D=M'))
+
+  def Static(out, offset, file_label):
+    out.extend((f'@{file_label}.{offset}', 'D=M'))
+
+  def Pointer(out, offset, file_label):
+    out.extend((At('THAT' if offset else 'THIS'), 'D=M'))
+
+  handlers = {
+      'constant': Constant,
+      'temp': Temp,
+      'static': Static,
+      'pointer': Pointer,
+  }
+  for segment, pointer in SEGMENT_POINTERS.items():
+    def FromSegmentPointer(out, offset, file_label, at_pointer=At(pointer)):
+      out.extend((at_pointer, 'D=M', At(offset), 'A=A+D', 'D=M'))
+    handlers[segment] = FromSegmentPointer
+  return handlers
 
 
-def LoadValueToD(segment: str, offset: int, file_label: str) -> List[str]:
+LOAD_D_HANDLERS = BuildLoadDHandlers()
+
+
+def LoadValueToD(out: List[str], segment: str, offset: int, file_label: str):
   """Load a value from the pointer specified by (segment, offset) into the D register."""
-  if segment == 'constant':
-    return ['@{}'.format(offset), 'D=A']
-  if segment == 'temp':
-    return ['@{}'.format(5 + offset), 'D=M']
-  if segment in SEGMENT_POINTERS:
-    return [
-        '@{}'.format(SEGMENT_POINTERS[segment]),
-        'D=M',
-        '@{}'.format(offset),
-        'A=A+D',
-        'D=M',
-    ]
-  if segment == 'static':
-    return [
-        '@{}.{}'.format(file_label, offset),
-        'D=M',
-    ]
-  if segment != 'pointer':
+  try:
+    handler = LOAD_D_HANDLERS[segment]
+  except KeyError:
     raise SyntaxError('Unexpected segment: {}'.format(segment))
-  return [
-      '@{}'.format('THAT' if offset else 'THIS'),
-      'D=M',
-  ]
+  handler(out, offset, file_label)
+
 
-def PushDRegisterToStack() -> List[str]:
+def PushDRegisterToStack(out: List[str]):
   """Push value in the D register onto the stack."""
-  return ['@SP', 'A=M', 'M=D', '@SP', 'M=M+1']
+  out.extend(PUSH_D_TO_STACK)
 
 
-def PopOp(segment: str, offset: int, file_label: str) -> List[str]:
+def PopOp(out: List[str], segment: str, offset: int, file_label: str):
   """Translates a stack pop operation into assembly code."""
-  result = LoadAddressIntoStackDataRegister(segment, offset, file_label)
-  result.extend(PopStackToDRegister())
-  result.extend(['@{}'.format(STACK_DATA_REGISTER), 'A=M', 'M=D'])
-  return result
+  LoadAddressIntoStackDataRegister(out, segment, offset, file_label)
+  PopStackToDRegister(out)
+  out.extend((At(STACK_DATA_REGISTER), 'A=M', 'M=D'))
+
+
+def BuildLoadAddressHandlers():
+  """Build one specialized address calculator per poppable memory segment.
+
+  Each handler leaves the target address in the D register; the shared
+  store into the stack data register happens in the dispatcher.
+  """
+  def Temp(out, offset, file_label):
+    out.extend((At(5 + offset), 'D=A'))
+
+  def Static(out, offset, file_label):
+    out.extend((f'@{file_label}.{offset}', 'D=A'))
+
+  def Pointer(out, offset, file_label):
+    out.extend((At('THAT' if offset else 'THIS'), 'D=A'))
+
+  handlers = {
+      'temp': Temp,
+      'static': Static,
+      'pointer': Pointer,
+  }
+  for segment, pointer in SEGMENT_POINTERS.items():
+    def FromSegmentPointer(out, offset, file_label, at_pointer=At(pointer)):
+      out.extend((at_pointer, 'D=M', At(offset), 'D=D+A'))
+    handlers[segment] = FromSegmentPointer
+  return handlers
+
+
+LOAD_ADDR_HANDLERS = BuildLoadAddressHandlers()
 
 
-def LoadAddressIntoStackDataRegister(segment: str, offset: int, file_label: str) -> List[str]:
+def LoadAddressIntoStackDataRegister(out: List[str], segment: str, offset: int,
+                                     file_label: str):
   """Load the address of the pointer determined by (segment, offset) into RAM[15]."""
-  result = []
-  if segment == 'temp':
-    result = ['@{}'.format(5 + offset), 'D=A']
-  elif segment in SEGMENT_POINTERS:
-    result = [
-        '@{}'.format(SEGMENT_POINTERS[segment]),
-        'D=M',
-        '@{}'.format(offset),
-        'D=D+A',
-    ]
-  elif segment == 'static':
-    result = [
-        '@{}.{}'.format(file_label, offset),
-        'D=A',
-    ]
-  elif segment == 'pointer':
-    result = [
-        '@{}'.format('THAT' if offset else 'THIS'),
-        'D=A',
-    ]
-  else:
+  try:
+    handler = LOAD_ADDR_HANDLERS[segment]
+  except KeyError:
     raise SyntaxError('Unexpected segment: {}'.format(segment))
-  result.extend(['@{}'.format(STACK_DATA_REGISTER), 'M=D'])
-  return result
+  handler(out, offset, file_label)
+  out.extend((At(STACK_DATA_REGISTER), 'M=D'))
 
 
-def PopStackToDRegister() -> List[str]:
+def PopStackToDRegister(out: List[str]):
   """Pop the stack into the D register."""
-  return ['@SP', 'AM=M-1', 'D=M']
+  out.extend(POP_STACK_TO_D)
 
 
-def BinaryOp(op: str) -> List[str]:
+def BinaryOp(out: List[str], op: str):
   """Translates a binary stack arithmetic operation into assembly."""
-  result = []
-  result.extend(PopStackToDRegister())
+  PopStackToDRegister(out)
   # Overwrite the top of the stack with the result.
-  result.extend(SetARegisterToTopOfStack())
+  SetARegisterToTopOfStack(out)
   if op == 'add':
-    result.append('M=M+D')
+    out.append('M=M+D')
   elif op == 'sub':
-    result.append('M=M-D')
+    out.append('M=M-D')
   elif op == 'and':
-    result.append('M=M&D')
+    out.append('M=M&D')
   else:  # op == or
-    result.append('M=M|D')
-  return result
+    out.append('M=M|D')
 
 
-def UnaryOp(op: str) -> List[str]:
+def UnaryOp(out: List[str], op: str):
   """Translates a unary stack arithmetic operation into assembly."""
-  result = SetARegisterToTopOfStack()
-  result.append('M=-M' if op == 'neg' else 'M=!M')
-  return result
+  SetARegisterToTopOfStack(out)
+  out.append('M=-M' if op == 'neg' else 'M=!M')
 
 
-def SetARegisterToTopOfStack() -> List[str]:
+def SetARegisterToTopOfStack(out: List[str]):
   """Set the A register to the address at the top of the stack."""
-  return ['@SP', 'A=M-1']
-
-
-def ComparisonOp(op: str, index: int, file_label: str) -> List[str]:
-  """Translate stack arithmetic comparison operations to assembly."""
-  if op == 'eq':
-    jump_cmd = 'JEQ'
-  elif op == 'lt':
-    jump_cmd = 'JLT'
-  else:  # op == gt
-    jump_cmd = 'JGT'
-  result = PopStackToDRegister()
-  result.extend(SetARegisterToTopOfStack())
-  result.extend([
+  out.extend(SET_A_TO_STACK_TOP)
+
+
+def ComparisonOp(out: List[str], op: str, index: int, file_label: str):
+  """Translate stack arithmetic comparison operations to assembly.
+
+  The whole body goes out in one extend: only the jump instruction and
+  the six label lines vary, everything else is shared literals.
+  """
+  true_label = f'{file_label}.InsertTrue.{index}'
+  end_label = f'{file_label}.End.{index}'
+  out.extend((
+      '@SP', 'AM=M-1', 'D=M',
+      '@SP', 'A=M-1',
       'D=M-D',
-      '@{}.InsertTrue.{}'.format(file_label, index),
-      'D;{}'.format(jump_cmd),
-  ])
-  result.extend(SetARegisterToTopOfStack())
-  result.extend([
+      '@' + true_label,
+      'D;' + COMPARISON_JUMPS[op],
+      '@SP', 'A=M-1',
       'M=0',
-      '@{}.End.{}'.format(file_label, index),
+      '@' + end_label,
       '0;JMP',
-      '({}.InsertTrue.{})'.format(file_label, index),
-  ])
-  result.extend(SetARegisterToTopOfStack())
-  result.extend([
+      '(' + true_label + ')',
+      '@SP', 'A=M-1',
       'M=-1',
-      '({}.End.{})'.format(file_label, index),
-  ])
-  return result
+      '(' + end_label + ')',
+  ))
 
 
-def LabelOp(file_label: str, label: str) -> List[str]:
+def LabelOp(out: List[str], file_label: str, label: str):
   """Translates a VM code label operation to assembly code."""
-  return ['({}.{})'.format(file_label, label)]
+  out.append(f'({file_label}.{label})')
 
 
-def GotoOp(file_label: str, label: str) -> List[str]:
+def GotoOp(out: List[str], file_label: str, label: str):
   """Translates a VM code if operation to assembly code."""
-  return ['@{}.{}'.format(file_label, label), '0;JMP']
+  out.extend((f'@{file_label}.{label}', '0;JMP'))
 
 
-def IfGotoOp(file_label: str, label: str) -> List[str]:
+def IfGotoOp(out: List[str], file_label: str, label: str):
   """Translates a VM code if-goto operation to assembly code."""
-  result = PopStackToDRegister()
-  result.extend([
-      '@{}.{}'.format(file_label, label),
+  PopStackToDRegister(out)
+  out.extend((
+      f'@{file_label}.{label}',
       'D;JNE',
-  ])
-  return result
+  ))
 
 
-def FunctionOp(fn_name: str, n_vars: int, file_label: str) -> List[str]:
+def FunctionOp(out: List[str], fn_name: str, n_vars: int, file_label: str):
   """Translates a VM code function operation to assembly code."""
-  result = ['({})'.format(fn_name)]
-  for _ in range(n_vars):
-    result.extend(PushOp('constant', 0, file_label))
-  return result
+  out.append(f'({fn_name})')
+  if n_vars:
+    # Tuple repetition expands all the locals in one C-level extend.
+    out.extend(PUSH_CONST_ZERO * n_vars)
 
 
-def CallOp(fn_name: str, index: int, n_args: int) -> List[str]:
+def CallOp(out: List[str], fn_name: str, index: int, n_args: int):
   """Translate a VM code call operation to assembly code."""
   # Add the stack frame
-  return_addr = '{}.ret.{}'.format(fn_name, index)
-  result = ['@{}'.format(return_addr), 'D=A']
-  result.extend(PushDRegisterToStack())
-  for addr in ['LCL', 'ARG', 'THIS', 'THAT']:
-    result.extend(['@{}'.format(addr), 'D=M'])
-    result.extend(PushDRegisterToStack())
-
-  result.extend([
+  return_addr = f'{fn_name}.ret.{index}'
+  out.extend((f'@{return_addr}', 'D=A'))
+  PushDRegisterToStack(out)
+  for addr in ('LCL', 'ARG', 'THIS', 'THAT'):
+    out.extend(PUSH_POINTER[addr])
+
+  out.extend((
       # Set ARG -> SP - 5 - nArgs
       '@SP',
       'D=M',
       '@5',
       'D=D-A',
-      '@{}'.format(n_args),
+      f'@{n_args}',
       'D=D-A',
       '@ARG',
       'M=D',
@@ -344,32 +490,32 @@ def CallOp(fn_name: str, index: int, n_args: int) -> List[str]:
       'D=M',
       '@LCL',
       'M=D',
-      # Go to function label
-      '@{}'.format(fn_name),
+      # Go to function label; At interns it, so calls to the same function
+      # from every file share one string.
+      At(fn_name),
       '0;JMP',
       # Label for return address
-      '({})'.format(return_addr)
-  ])
-  return result
+      f'({return_addr})'
+  ))
 
 
-def ReturnOp() -> List[str]:
+def ReturnOp(out: List[str]):
   """Translate the VM code return operation to assembly code."""
   # Save return address, stored in LCL-5, to RETURN_ADDR_TMP_REGISTER
   # in case there were no arguments.
-  result = [
+  out.extend((
       '@LCL',
       'D=M',
       '@5',
       'A=D-A',
       'D=M',
-      '@{}'.format(RETURN_ADDR_TMP_REGISTER),
+      At(RETURN_ADDR_TMP_REGISTER),
       'M=D',
-  ]
+  ))
   # Save top of working stack to ARG+0
-  result.extend(PopStackToDRegister())
-  result.extend(['@ARG', 'A=M', 'M=D'])
-  result.extend([
+  PopStackToDRegister(out)
+  out.extend(('@ARG', 'A=M', 'M=D'))
+  out.extend((
       # Set SP to ARG+1
       '@ARG',
       'D=M+1',
@@ -378,23 +524,22 @@ def ReturnOp() -> List[str]:
       # Store current value in LCL in the LCL_TMP_REGISTER register.
       '@LCL',
       'D=M',
-      '@{}'.format(LCL_TMP_REGISTER),
+      At(LCL_TMP_REGISTER),
       'M=D',
-  ])
+  ))
   # Restore segment pointers
   for i, addr in enumerate(['THAT', 'THIS', 'ARG', 'LCL']):
-    result.extend([
-        '@{}'.format(LCL_TMP_REGISTER),
+    out.extend((
+        At(LCL_TMP_REGISTER),
         'D=M',
-        '@{}'.format(i + 1),
+        At(i + 1),
         'A=D-A',
         'D=M',
-        '@{}'.format(addr),
+        At(addr),
         'M=D',
-    ])
+    ))
   # Jump to return address, stored in RETURN_ADDR_TMP_REGISTER
-  result.extend(['@{}'.format(RETURN_ADDR_TMP_REGISTER), 'A=M', '0;JMP'])
-  return result
+  out.extend((At(RETURN_ADDR_TMP_REGISTER), 'A=M', '0;JMP'))
 
 
 def TranslateVMFilesToASM(vm_file_paths: List[str]) -> List[str]:
@@ -407,40 +552,53 @@ def TranslateVMFilesToASM(vm_file_paths: List[str]) -> List[str]:
       break
   if idx == -1:
     raise FileNotFoundError('Cannot find Sys.vm')
-  vm_file_paths = vm_file_paths.copy()
+  # Swap Sys.vm to the front in place; no caller relies on the argument's
+  # order, so there is no need to copy the whole list first.
   vm_file_paths[0], vm_file_paths[idx] = vm_file_paths[idx], vm_file_paths[0]
-  result = BootCode()
-  for vm_file in vm_file_paths:
-    result.extend(TranslateVMFiletoASM(vm_file, call_counts))
+  result = []
+  BootCode(result)
+  # Prefetch all the file contents on a thread pool; open/read release the
+  # GIL, so the reads overlap each other and the translation below.
+  # Translation itself stays in file order, which keeps the shared call
+  # counter (and thus every return label) deterministic.
+  with ThreadPoolExecutor(
+      max_workers=min(8, len(vm_file_paths))) as executor:
+    contents = executor.map(ReadVMFile, vm_file_paths)
+    for vm_file, vm_file_content in zip(vm_file_paths, contents):
+      result.extend(
+          TranslateVMFiletoASM(vm_file, call_counts, vm_file_content))
   return result
 
 
-def BootCode() -> List[str]:
+def BootCode(out: List[str]):
   """Boot code sets SP -> 256, LCL -> -1, ARG -> -2, THIS -> -3, THAT -> -4 and calls Sys.init"""
-  result = BootPointer('SP', 256)
+  BootPointer(out, 'SP', 256)
   for ptr_name, value in [('LCL', -1), ('ARG', -2), ('THIS', -3),
                           ('THAT', -4)]:
-    result.extend(BootPointer(ptr_name, value))
-  result.extend(CallOp('Sys.init', 0, 0))
-  return result
+    BootPointer(out, ptr_name, value)
+  CallOp(out, 'Sys.init', 0, 0)
 
 
-def BootPointer(ptr_name: str, value: int) -> List[str]:
+def BootPointer(out: List[str], ptr_name: str, value: int):
   """Boot the pointer to the provided value."""
   if value >= 0:
-    result = ['@{}'.format(value), 'D=A']
+    out.extend((f'@{value}', 'D=A'))
   else:
-    result = ['@{}'.format(-value), 'D=-A']
-  result.extend(['@{}'.format(ptr_name), 'M=D'])
-  return result
+    out.extend((f'@{-value}', 'D=-A'))
+  out.extend((f'@{ptr_name}', 'M=D'))
 
 
 def WriteOutput(asm_tokens: List[str], outp_path: str):
-  """Writes the resulting assembly tokens to the output .asm path."""
-  asm_tokens.append('')
-  asm_content = '\n'.join(asm_tokens)
-  with open(outp_path, 'w') as f:
-    f.write(asm_content)
+  """Writes the resulting assembly tokens to the output .asm path.
+
+  The lines are joined and written in fixed-size chunks so the transient
+  join buffer stays small no matter how many files were translated; the
+  large file buffer keeps the number of write syscalls low.
+  """
+  with open(outp_path, 'w', buffering=1 << 20) as f:
+    for i in range(0, len(asm_tokens), 4096):
+      f.write('\n'.join(asm_tokens[i:i + 4096]))
+      f.write('\n')
 
 
 def main():
@@ -17,9 +17,14 @@ Parser:
 """
 
 
+import functools
+import io
+import mmap
 import os
+import re
 import sys
 
+from concurrent.futures import ProcessPoolExecutor
 from typing import List, NamedTuple, Tuple
 
 
@@ -32,11 +37,28 @@ SYMBOLS = {'{', '}', '(', ')', '[', ']', '.', ',', ';', '+', '-', '*', '/',
 
 WHITESPACE = {' ', '\t', '\r'}
 
-BINARY_OPS = {'+', '-', '*', '/', '&', '|', '<', '>', '='}
+BINARY_OPS = frozenset({'+', '-', '*', '/', '&', '|', '<', '>', '='})
 
-UNARY_OPS = {'-', '~'}
+UNARY_OPS = frozenset({'-', '~'})
 
-KEYWORD_CONSTANTS = {'true', 'false', 'null', 'this'}
+KEYWORD_CONSTANTS = frozenset({'true', 'false', 'null', 'this'})
+
+# Matches one Jack token per match: a string constant, a symbol, a run of
+# word characters starting with a digit (a valid integer constant or a
+# malformed identifier), or an identifier/keyword. Comments match the
+# groupless alternatives and whitespace matches nothing, so both are
+# skipped implicitly; a bare '/*' or '"' only matches when a multiline
+# comment or a string never terminates. The whole source is scanned
+# exactly once.
+JACK_TOKEN_RE = re.compile(
+    r'/\*[\s\S]*?\*/'
+    r'|/\*'
+    r'|//[^\n]*'
+    r'|"([^"\n]*)"'
+    r'|([{}()\[\].,;+\-*/&|<>=~])'
+    r'|(\d\w*)'
+    r'|([A-Za-z_]\w*)'
+    r'|"')
 
 
 class InvalidInputError(Exception):
@@ -55,181 +77,177 @@ def ParseJackFilePathsFromArguments() -> List[str]:
   inp_path = sys.argv[1]
   if not os.path.isdir(inp_path):
     raise InvalidInputError()
-  jack_filenames = [fname for fname in os.listdir(inp_path)
-                          if fname.endswith('.jack')]
+  # scandir yields DirEntry objects with the name cached from one syscall
+  # sweep, unlike listdir + per-name stat on some filesystems.
+  with os.scandir(inp_path) as entries:
+    jack_filenames = [entry.name for entry in entries
+                      if entry.is_file() and entry.name.endswith('.jack')]
   if 'Main.jack' not in jack_filenames:
     raise InvalidInputError('Directory must contain a Main.jack file')
   return [os.path.join(inp_path, fname) for fname in jack_filenames]
 
 
+# Integer token kinds. Each Token subclass carries its kind as a class
+# attribute; comparing two small ints is cheaper than the isinstance calls
+# the parser would otherwise make per token.
+KEYWORD, SYMBOL, INTEGER_CONSTANT, STRING_CONSTANT, IDENTIFIER = range(5)
+
+# XML tag name for each token kind, indexed by the constants above.
+TOKEN_TAG_NAMES = (
+    'keyword', 'symbol', 'integerConstant', 'stringConstant', 'identifier')
+
+# Escaped forms of the symbol tokens that are XML-significant. Only whole
+# values are mapped: symbol tokens are single characters, and string
+# constants pass through untouched like they always have.
+XML_ESCAPES = {'<': '&lt;', '>': '&gt;', '&': '&amp;'}
+
+
 class Token(object):
   """Base token class, all other tokens inherit from this class."""
+  # Tokens are allocated tens of thousands of times per compilation, so
+  # they are slotted to skip the per-instance __dict__.
+  __slots__ = ('value',)
+
   def __init__(self, value):
     self.value = value
 
   def __eq__(self, other) -> bool:
-    return ((self.__class__, self.value) ==
-            (other.__class__, other.value))
+    if self is other:
+      # Keyword and symbol tokens are canonical instances, so most
+      # comparisons resolve here without building tuples.
+      return True
+    return self.kind == other.kind and self.value == other.value
 
   def TagName(self) -> str:
-    """Virtual method that gets the Token's XML tag name."""
-    raise NotImplementedError('TagName not implemented')
+    """Gets the Token's XML tag name from its kind."""
+    return TOKEN_TAG_NAMES[self.kind]
 
   def Value(self) -> str:
     """Value property formatted for XML"""
     if not isinstance(self.value, str):
       return str(self.value)
-    if self.value == '<':
-      return '&lt;'
-    if self.value == '>':
-      return '&gt;'
-    if self.value == '&':
-      return '&amp;'
-    return self.value
+    return XML_ESCAPES.get(self.value, self.value)
 
 class KeywordToken(Token):
-  def TagName(self) -> str:
-    return 'keyword'
+  __slots__ = ()
+  kind = KEYWORD
 
 class SymbolToken(Token):
-  def TagName(self) -> str:
-    return 'symbol'
+  __slots__ = ()
+  kind = SYMBOL
 
 class IntegerConstantToken(Token):
-  def TagName(self) -> str:
-    return 'integerConstant'
+  __slots__ = ()
+  kind = INTEGER_CONSTANT
 
 class StringConstantToken(Token):
-  def TagName(self) -> str:
-    return 'stringConstant'
+  __slots__ = ()
+  kind = STRING_CONSTANT
 
 class IdentifierToken(Token):
-  def TagName(self) -> str:
-    return 'identifier'
+  __slots__ = ()
+  kind = IDENTIFIER
+
+
+# Canonical (flyweight) instances of every keyword and symbol token. The
+# tokenizer hands out these shared objects, so the parser can compare with
+# identity instead of building throwaway tokens and tuples per check.
+KEYWORD_TOKENS = {keyword: KeywordToken(keyword) for keyword in KEYWORDS}
+SYMBOL_TOKENS = {symbol: SymbolToken(symbol) for symbol in SYMBOLS}
 
 
 def Tokenize(jack_file_path: str) -> List[Token]:
   """Tokenize the content of a .jack file path."""
-  with open(jack_file_path, 'r') as f:
-    jack_file_content = f.read()
-  jack_file_content = RemoveMultilineComments(jack_file_content)
-  jack_file_lines = RemoveSingleLineComments(jack_file_content.split('\n'))
-  tokens = []
-  for line in jack_file_lines:
-    tokens.extend(TokenizeLine(line))
-  if tokens[0] != KeywordToken('class'):
+  # Map the file instead of read(): the kernel pages the source in as one
+  # sequential run and the decode is the only copy made. Empty files
+  # cannot be mapped, so they short-circuit; comments may legitimately
+  # hold non-ASCII bytes, so decode UTF-8 as text-mode open() did.
+  with open(jack_file_path, 'rb') as f:
+    if os.fstat(f.fileno()).st_size == 0:
+      jack_file_content = ''
+    else:
+      with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        jack_file_content = bytes(mm).decode('utf-8')
+  tokens = TokenizeBuffer(jack_file_content)
+  if tokens[0] is not KEYWORD_TOKENS['class']:
     raise SyntaxError('Expected class')
-  if tokens[-1] != SymbolToken('}'):
+  if tokens[-1] is not SYMBOL_TOKENS['}']:
     raise SyntaxError('Unexpected characters after }')
   return tokens
 
 
-def RemoveMultilineComments(jack_file_content: str) -> str:
-  """Strips away any multiline comments from the .jack file."""
-  result = []
-  while True:
-    try:
-      idx = jack_file_content.index('/*')
-      result.append(jack_file_content[:idx])
-    except ValueError:
-      result.append(jack_file_content)
-      break
-    try:
-      jack_file_content = jack_file_content[idx+2:]
-      idx = jack_file_content.index('*/')
-      jack_file_content = jack_file_content[idx+2:]
-    except ValueError:
-      raise SyntaxError('Expected */ before end of file')
-  return ''.join(result)
-
-
-def RemoveSingleLineComments(jack_file_lines: List[str]) -> List[str]:
-  """Remove any single line comments and empty lines."""
-  result = []
-  for line in jack_file_lines:
-    try:
-      line = line[:line.index('//')]
-      if line:
-        result.append(line)
-    except ValueError:
-      result.append(line)
-  return result
+def TokenizeBuffer(jack_file_content: str) -> List[Token]:
+  """Tokenize Jack code with a single pass of the token regex.
 
-
-def TokenizeLine(line: str) -> List[Token]:
-  """Tokenize a line of Jack code. Always non-empty."""
-  i = 0
-  cur = ''
+  The scan covers the whole buffer at once, so there is no per-line
+  splitting and no separate comment-stripping pass; both comment styles
+  match groupless alternatives of the regex and fall through the
+  classification below.
+  """
   tokens = []
-  while i < len(line):
-    if line[i] in WHITESPACE:
-      if cur:
-        tokens.append(TokenizeString(cur))
-        cur = ''
-      i += 1
-      continue
-    if line[i] in SYMBOLS:
-      if cur:
-        tokens.append(TokenizeString(cur))
-        cur = ''
-      tokens.append(SymbolToken(line[i]))
-      i += 1
-      continue
-    if line[i] == '"':
-      if cur:
-        raise SyntaxError('Unexpected characters before string')
-      try:
-        j = line[i+1:].index('"')
-      except ValueError:
-        raise SyntaxError('Expected string to end before line ends')
-      tokens.append(StringConstantToken(line[i+1:i+1+j]))
-      i += j + 2
-      continue
-    cur += line[i]
-    i += 1
+  tokens_append = tokens.append
+  for match in JACK_TOKEN_RE.finditer(jack_file_content):
+    string, symbol, number, word = match.groups()
+    if word is not None:
+      tokens_append(
+          KEYWORD_TOKENS[word] if word in KEYWORDS else IdentifierToken(word))
+    elif symbol is not None:
+      tokens_append(SYMBOL_TOKENS[symbol])
+    elif number is not None:
+      if not number.isdigit():
+        raise SyntaxError('Identifiers cannot start with numbers')
+      tokens_append(IntegerConstantToken(int(number)))
+    elif string is not None:
+      tokens_append(StringConstantToken(string))
+    elif match.group(0) == '/*':
+      # Only an unterminated multiline comment matches the bare '/*'
+      # alternative; a terminated one consumes through its '*/'.
+      raise SyntaxError('Expected */ before end of file')
+    elif match.group(0) == '"':
+      # Likewise a complete string consumes its closing quote, so a
+      # bare '"' only matches when the string never ends on its line.
+      raise SyntaxError('Expected string to end before line ends')
   return tokens
 
 
-def TokenizeString(value: str) -> Token:
-  """Tokenize the given string"""
-  if not value:
-    raise InvalidInputError('Expected non-empty string')
-  if value in KEYWORDS:
-    return KeywordToken(value)
-  try:
-    return IntegerConstantToken(int(value))
-  except ValueError:
-    pass
-  try:
-    int(value[0])
-    raise SyntaxError('Identifiers cannot start with numbers')
-  except ValueError:
-    pass
-  return IdentifierToken(value)
+# Indentation strings cached by width; XML trees rarely nest past this,
+# and wider indents fall back to building the string.
+INDENT_PADS = tuple(' ' * i for i in range(64))
 
 
 class XMLTag:
   """Class encapsulates building an XML tag string"""
+  __slots__ = ('tag_name', 'text', 'children')
+
   def __init__(self, tag_name: str):
     self.tag_name = tag_name
     self.text = ''
     self.children = []
 
   def __str__(self):
+    out = io.StringIO()
+    self.WriteTo(out)
+    # Drop the trailing newline so str(tag) composes the same as before.
+    return out.getvalue()[:-1]
+
+  def WriteTo(self, out, indent: int = 0):
+    """Write this tag and its subtree into out, one line at a time.
+
+    The cumulative indent travels down the walk as an integer, so each
+    line is emitted exactly once; the old __str__ recursion re-split and
+    re-prefixed every descendant's lines once per ancestor.
+    """
+    pad = INDENT_PADS[indent] if indent < 64 else ' ' * indent
     if not self.children:
       if self.text:
-        return f'<{self.tag_name}> {self.text} </{self.tag_name}>'
+        out.write(f'{pad}<{self.tag_name}> {self.text} </{self.tag_name}>\n')
       else:
-        return f'<{self.tag_name}>\n</{self.tag_name}>'
-    lines = [f'<{self.tag_name}>']
+        out.write(f'{pad}<{self.tag_name}>\n{pad}</{self.tag_name}>\n')
+      return
+    out.write(f'{pad}<{self.tag_name}>\n')
     for child in self.children:
-      child_lines = str(child.xml).split('\n')
-      indent = ' ' * child.indent
-      for i, line in enumerate(child_lines):
-        child_lines[i] = f'{indent}{line}'
-      lines.extend(child_lines)
-    lines.append(f'</{self.tag_name}>')
-    return '\n'.join(lines)
+      child.xml.WriteTo(out, indent + child.indent)
+    out.write(f'{pad}</{self.tag_name}>\n')
 
   def Text(self, text: str):
     self.text = text
@@ -247,48 +265,58 @@ def WriteTokensXML(jack_file_path: str, tokens: List[Token]) -> str:
   """Write the tokenized .jack file into a .xml file."""
   out_dir, jack_filename = os.path.split(jack_file_path)
   out_path = os.path.join(out_dir, jack_filename.replace('.jack', 'T.xml'))
-  with open(out_path, 'w') as f:
-    f.write(TokensToXMLString(tokens))
-
-
-def TokensToXMLString(tokens: List[Token]) -> str:
-  """Generate an XML string from a list of tokens."""
   xml = XMLTag('tokens')
   for token in tokens:
     child = XMLTag(token.TagName())
     child.Text(token.Value())
     xml.AddChild(child)
-  result = str(xml)
-  return result + '\n'
+  # Stream the tags straight into the file buffer instead of materializing
+  # the whole document as one string first.
+  with open(out_path, 'w', buffering=1 << 16) as f:
+    xml.WriteTo(f)
 
 
 class SyntaxTreeNode:
   """Base class for a node in the abstract syntax tree."""
+  __slots__ = ()
+
   def TagName(self):
     raise NotImplementedError('TagName not implemented')
 
 
 class TerminalNode(SyntaxTreeNode):
-  pass
+  __slots__ = ()
+
+  def WriteXML(self, out, indent: int = 0):
+    """Write this node's XML line directly into out."""
+    pad = INDENT_PADS[indent] if indent < 64 else ' ' * indent
+    tag_name = self.TagName()
+    text = self.Value()
+    if text:
+      out.write(f'{pad}<{tag_name}> {text} </{tag_name}>\n')
+    else:
+      out.write(f'{pad}<{tag_name}>\n{pad}</{tag_name}>\n')
 
 # Terminal nodes inherit from Token classes for TagName and Value
 class KeywordNode(KeywordToken, TerminalNode):
-  pass
+  __slots__ = ()
 
 class SymbolNode(SymbolToken, TerminalNode):
-  pass
+  __slots__ = ()
 
 class IntegerConstantNode(IntegerConstantToken, TerminalNode):
-  pass
+  __slots__ = ()
 
 class StringConstantNode(StringConstantToken, TerminalNode):
-  pass
+  __slots__ = ()
 
 class IdentifierNode(IdentifierToken, TerminalNode):
-  pass
+  __slots__ = ()
 
 
 class NonTerminalNode(SyntaxTreeNode):
+  __slots__ = ('children',)
+
   def __init__(self):
     super(NonTerminalNode, self).__init__()
     self.children = []
@@ -297,108 +325,166 @@ class NonTerminalNode(SyntaxTreeNode):
     """Add a new child to the subtree."""
     self.children.append(child)
 
-  def AddChildren(self, *children: List[SyntaxTreeNode]):
-    """Add a list of children to the subtree."""
+  def AddChildren(self, children: List[SyntaxTreeNode]):
+    """Add a list of children to the subtree.
+
+    Takes the iterable itself; callers pass their list straight through
+    rather than splatting it into an argument tuple."""
     self.children.extend(children)
 
+  def WriteXML(self, out, indent: int = 0):
+    """Write this subtree's XML directly into out, one line at a time.
+
+    The syntax tree serializes itself, so no parallel XMLTag tree is
+    built and the tree is walked exactly once."""
+    pad = INDENT_PADS[indent] if indent < 64 else ' ' * indent
+    tag_name = self.TagName()
+    if not self.children:
+      out.write(f'{pad}<{tag_name}>\n{pad}</{tag_name}>\n')
+      return
+    out.write(f'{pad}<{tag_name}>\n')
+    child_indent = indent + 2
+    for child in self.children:
+      child.WriteXML(out, child_indent)
+    out.write(f'{pad}</{tag_name}>\n')
+
 class ClassNode(NonTerminalNode):
+  __slots__ = ()
+
   def TagName(self):
     return 'class'
 
 class ClassVarDecNode(NonTerminalNode):
+  __slots__ = ()
+
   def TagName(self):
     return 'classVarDec'
 
 class SubroutineDecNode(NonTerminalNode):
+  __slots__ = ()
+
   def TagName(self):
     return 'subroutineDec'
 
 class ParameterListNode(NonTerminalNode):
+  __slots__ = ()
+
   def TagName(self):
     return 'parameterList'
 
 class SubroutineBodyNode(NonTerminalNode):
+  __slots__ = ()
+
   def TagName(self):
     return 'subroutineBody'
 
 class VarDecNode(NonTerminalNode):
+  __slots__ = ()
+
   def TagName(self):
     return 'varDec'
 
 class StatementsNode(NonTerminalNode):
+  __slots__ = ()
+
   def TagName(self):
     return 'statements'
 
 class LetStatementNode(NonTerminalNode):
+  __slots__ = ()
+
   def TagName(self):
     return 'letStatement'
 
 class DoStatementNode(NonTerminalNode):
+  __slots__ = ()
+
   def TagName(self):
     return 'doStatement'
 
 class ReturnStatementNode(NonTerminalNode):
+  __slots__ = ()
+
   def TagName(self):
     return 'returnStatement'
 
 class WhileStatementNode(NonTerminalNode):
+  __slots__ = ()
+
   def TagName(self):
     return 'whileStatement'
 
 class IfStatementNode(NonTerminalNode):
+  __slots__ = ()
+
   def TagName(self):
     return 'ifStatement'
 
 class ExpressionNode(NonTerminalNode):
+  __slots__ = ()
+
   def TagName(self):
     return 'expression'
 
 class TermNode(NonTerminalNode):
+  __slots__ = ()
+
   def TagName(self):
     return 'term'
 
 class ExpressionListNode(NonTerminalNode):
+  __slots__ = ()
+
   def TagName(self):
     return 'expressionList'
 
 
+# Canonical (flyweight) node instances for every keyword and symbol, like
+# KEYWORD_TOKENS/SYMBOL_TOKENS but for the syntax tree. Nodes are read-only
+# once built, so the same instance can appear in many subtrees.
+KEYWORD_NODES = {keyword: KeywordNode(keyword) for keyword in KEYWORDS}
+SYMBOL_NODES = {symbol: SymbolNode(symbol) for symbol in SYMBOLS}
+
+
 def CompileClass(tokens: List[Token]) -> ClassNode:
   """Compile a class statement from tokens."""
-  if (tokens[0] != KeywordToken('class')
-      or (not isinstance(tokens[1], IdentifierToken))
-      or tokens[2] != SymbolToken('{')
-      or tokens[-1] != SymbolToken('}')):
+  if (tokens[0] is not KEYWORD_TOKENS['class']
+      or tokens[1].kind != IDENTIFIER
+      or tokens[2] is not SYMBOL_TOKENS['{']
+      or tokens[-1] is not SYMBOL_TOKENS['}']):
     raise InvalidInputError('Invalid class')
   node = ClassNode()
   node.AddChildren(
-      KeywordNode('class'), IdentifierNode(tokens[1].Value()), SymbolNode('{'))
+      (KEYWORD_NODES['class'], IdentifierNode(tokens[1].Value()),
+       SYMBOL_NODES['{']))
 
-  tokens = tokens[3:-1]
-  nodes, i = CompileClassVarDecs(tokens)
-  node.AddChildren(*nodes)
+  # The class body runs from after the opening brace to before the closing
+  # one. Passing bounds instead of slicing avoids copying the token list.
+  end = len(tokens) - 1
+  nodes, i = CompileClassVarDecs(tokens, 3, end)
+  node.AddChildren(nodes)
 
-  tokens = tokens[i:]
-  node.AddChildren(*CompileSubroutines(tokens))
+  node.AddChildren(CompileSubroutines(tokens, i, end))
 
-  node.AddChild(SymbolNode('}'))
+  node.AddChild(SYMBOL_NODES['}'])
   return node
 
 
 def CompileClassVarDecs(
-    tokens: List[Token]) -> Tuple[List[ClassVarDecNode], int]:
-  """Compile the class variable declarations."""
-  i = 0
+    tokens: List[Token], i: int,
+    end: int) -> Tuple[List[ClassVarDecNode], int]:
+  """Compile the class variable declarations in tokens[i:end]."""
   nodes = []
-  while (tokens[i] == KeywordToken('static')
-         or tokens[i] == KeywordToken('field')):
+  while (tokens[i] is KEYWORD_TOKENS['static']
+         or tokens[i] is KEYWORD_TOKENS['field']):
     node = ClassVarDecNode()
-    node.AddChild(KeywordNode(tokens[i].Value()))
+    node.AddChild(KEYWORD_NODES[tokens[i].value])
     i += 1
     node.AddChild(ParseType(tokens[i]))
     i += 1
 
     children, i = ParseVarNames(tokens, i)
-    node.AddChildren(*children)
+    node.AddChildren(children)
 
     nodes.append(node)
   return nodes, i
@@ -409,72 +495,84 @@ def ParseVarNames(
   """Parse a single or multiple comma separated variable names of the same type."""
   nodes = []
   syntax_err = SyntaxError('Invalid variable name')
-  if not isinstance(tokens[i], IdentifierToken):
+  if tokens[i].kind != IDENTIFIER:
     raise syntax_err
   nodes.append(IdentifierNode(tokens[i].Value()))
   i += 1
 
-  while tokens[i] == SymbolToken(','):
-    nodes.append(SymbolNode(','))
+  while tokens[i] is SYMBOL_TOKENS[',']:
+    nodes.append(SYMBOL_NODES[','])
     i += 1
-    if not isinstance(tokens[i], IdentifierToken):
+    if tokens[i].kind != IDENTIFIER:
       raise syntax_err
     nodes.append(IdentifierNode(tokens[i].Value()))
     i += 1
 
-  if tokens[i] != SymbolToken(';'):
+  if tokens[i] is not SYMBOL_TOKENS[';']:
     raise syntax_err
-  nodes.append(SymbolNode(';'))
+  nodes.append(SYMBOL_NODES[';'])
   i += 1
   return nodes, i
 
 
+@functools.lru_cache(maxsize=256)
+def TypeIdentifierNode(name: str) -> IdentifierNode:
+  """Memoized identifier node for a user-defined type name.
+
+  A class uses the same handful of type names over and over; nodes are
+  read-only once built, so repeats share one instance like KEYWORD_NODES.
+  """
+  return IdentifierNode(name)
+
+
 def ParseType(token: Token):
   """Parse a token used to indicate a variable's type."""
-  if isinstance(token, KeywordToken):
-    return KeywordNode(token.Value())
-  if isinstance(token, IdentifierToken):
-    return IdentifierNode(token.Value())
+  if token.kind == KEYWORD:
+    return KEYWORD_NODES[token.value]
+  if token.kind == IDENTIFIER:
+    return TypeIdentifierNode(token.value)
   raise SyntaxError('Invalid type')
 
 
-def CompileSubroutines(tokens: List[Token]) -> List[SubroutineDecNode]:
-  """Compile subroutine declarations"""
+def CompileSubroutines(
+    tokens: List[Token], i: int, end: int) -> List[SubroutineDecNode]:
+  """Compile the subroutine declarations in tokens[i:end]."""
   nodes = []
-  i = 0
   syntax_err = SyntaxError('Invalid subroutine declaration')
-  while i < len(tokens):
+  while i < end:
     node = SubroutineDecNode()
 
-    if not (tokens[i] == KeywordToken('constructor')
-            or tokens[i] == KeywordToken('method')
-            or tokens[i] == KeywordToken('function')):
+    if not (tokens[i] is KEYWORD_TOKENS['constructor']
+            or tokens[i] is KEYWORD_TOKENS['method']
+            or tokens[i] is KEYWORD_TOKENS['function']):
       raise syntax_err
-    node.AddChild(KeywordNode(tokens[i].Value()))
+    node.AddChild(KEYWORD_NODES[tokens[i].value])
     i += 1
 
-    if tokens[i] == KeywordToken('void'):
-      node.AddChild(KeywordNode('void'))
+    if tokens[i] is KEYWORD_TOKENS['void']:
+      node.AddChild(KEYWORD_NODES['void'])
     else:
       node.AddChild(ParseType(tokens[i]))
     i += 1
 
-    if not isinstance(tokens[i], IdentifierToken):
+    if tokens[i].kind != IDENTIFIER:
       raise syntax_err
     node.AddChild(IdentifierNode(tokens[i].Value()))
     i += 1
 
-    if tokens[i] != SymbolToken('('):
+    if tokens[i] is not SYMBOL_TOKENS['(']:
       raise syntax_err
-    node.AddChild(SymbolNode('('))
+    node.AddChild(SYMBOL_NODES['('])
 
-    j = i + 1
-    while tokens[j] != SymbolToken(')') and j < len(tokens):
-      j += 1
-    if j == len(tokens):
+    # Parameter lists cannot nest parentheses, so the first ')' closes the
+    # list; list.index scans at C speed and the flyweight symbol token
+    # short-circuits each comparison on identity.
+    try:
+      j = tokens.index(SYMBOL_TOKENS[')'], i + 1, end)
+    except ValueError:
       raise syntax_err
-    node.AddChild(ParseParameterList(tokens[i+1:j]))
-    node.AddChild(SymbolNode(')'))
+    node.AddChild(ParseParameterList(tokens, i + 1, j))
+    node.AddChild(SYMBOL_NODES[')'])
     i = j + 1
 
     child, i = CompileSubroutineBody(tokens, i)
@@ -484,23 +582,20 @@ def CompileSubroutines(tokens: List[Token]) -> List[SubroutineDecNode]:
   return nodes
 
 
-def ParseParameterList(tokens: List[Token]) -> ParameterListNode:
-  """Parse a parameter list from the given tokens for a subroutine declaration.
-  
-  Tokens list should only contain tokens in the parameter list."""
+def ParseParameterList(tokens: List[Token], i: int, end: int) -> ParameterListNode:
+  """Parse a subroutine declaration's parameter list from tokens[i:end]."""
   node = ParameterListNode()
-  i = 0
-  while i < len(tokens):
+  while i < end:
     node.AddChild(ParseType(tokens[i]))
     i += 1
 
-    if not isinstance(tokens[i], IdentifierToken):
+    if tokens[i].kind != IDENTIFIER:
       raise SyntaxError('Invalid parameter list')
     node.AddChild(IdentifierNode(tokens[i].Value()))
     i += 1
 
-    if i < len(tokens) and tokens[i] == SymbolToken(','):
-      node.AddChild(SymbolNode(','))
+    if i < end and tokens[i] is SYMBOL_TOKENS[',']:
+      node.AddChild(SYMBOL_NODES[','])
       i += 1
   return node
 
@@ -510,20 +605,20 @@ def CompileSubroutineBody(
   """Compile the variable declarations and statements in the body of a subroutine."""
   node = SubroutineBodyNode()
 
-  if tokens[i] != SymbolToken('{'):
+  if tokens[i] is not SYMBOL_TOKENS['{']:
     raise SyntaxError('Invalid subroutine body')
-  node.AddChild(SymbolNode('{'))
+  node.AddChild(SYMBOL_NODES['{'])
   i += 1
 
   nodes, i = CompileVarDecs(tokens, i)
-  node.AddChildren(*nodes)
+  node.AddChildren(nodes)
 
   child, i = CompileStatements(tokens, i)
   node.AddChild(child)
   
-  if tokens[i] != SymbolToken('}'):
+  if tokens[i] is not SYMBOL_TOKENS['}']:
     raise SyntaxError('Invalid subroutine body')
-  node.AddChild(SymbolNode('}'))
+  node.AddChild(SYMBOL_NODES['}'])
   i += 1
 
   return node, i
@@ -533,16 +628,16 @@ def CompileVarDecs(
     tokens: List[Token], i: int) -> Tuple[List[VarDecNode], int]:
   """Compile the variable declarations in a subroutine body."""
   nodes = []
-  while tokens[i] == KeywordToken('var'):
+  while tokens[i] is KEYWORD_TOKENS['var']:
     node = VarDecNode()
-    node.AddChild(KeywordNode('var'))
+    node.AddChild(KEYWORD_NODES['var'])
     i += 1
 
     node.AddChild(ParseType(tokens[i]))
     i += 1
 
     children, i = ParseVarNames(tokens, i)
-    node.AddChildren(*children)
+    node.AddChildren(children)
 
     nodes.append(node)
   return nodes, i
@@ -552,28 +647,16 @@ def CompileStatements(
     tokens: List[Token], i: int) -> Tuple[StatementsNode, int]:
   """Compile the statements in a subroutine body."""
   node = StatementsNode()
-  while tokens[i] != SymbolToken('}'):
-    if tokens[i] == KeywordToken('let'):
-      child, i = CompileLetStatement(tokens, i)
-      node.AddChild(child)
-      continue
-    if tokens[i] == KeywordToken('do'):
-      child, i = CompileDoStatement(tokens, i)
-      node.AddChild(child)
-      continue
-    if tokens[i] == KeywordToken('return'):
-      child, i = CompileReturnStatement(tokens, i)
-      node.AddChild(child)
-      continue
-    if tokens[i] == KeywordToken('while'):
-      child, i = CompileWhileStatement(tokens, i)
-      node.AddChild(child)
-      continue
-    if tokens[i] == KeywordToken('if'):
-      child, i = CompileIfStatement(tokens, i)
-      node.AddChild(child)
-      continue
-    raise SyntaxError('Invalid statement')
+  while tokens[i] is not SYMBOL_TOKENS['}']:
+    token = tokens[i]
+    if token.kind != KEYWORD:
+      raise SyntaxError('Invalid statement')
+    try:
+      compile_statement = STATEMENT_COMPILERS[token.value]
+    except KeyError:
+      raise SyntaxError('Invalid statement')
+    child, i = compile_statement(tokens, i)
+    node.AddChild(child)
   return node, i
 
 
@@ -581,36 +664,36 @@ def CompileLetStatement(
     tokens: List[Token], i: int) -> Tuple[LetStatementNode, int]:
   """Compile a let statement."""
   node = LetStatementNode()
-  node.AddChild(KeywordNode('let'))
+  node.AddChild(KEYWORD_NODES['let'])
   i += 1
 
   syntax_err = SyntaxError('Invalid let statement')
-  if not isinstance(tokens[i], IdentifierToken):
+  if tokens[i].kind != IDENTIFIER:
     raise syntax_err
   node.AddChild(IdentifierNode(tokens[i].Value()))
   i += 1
 
-  if tokens[i] == SymbolToken('['):
-    node.AddChild(SymbolNode('['))
+  if tokens[i] is SYMBOL_TOKENS['[']:
+    node.AddChild(SYMBOL_NODES['['])
     i += 1
     child, i = CompileExpression(tokens, i)
     node.AddChild(child)
-    if tokens[i] != SymbolToken(']'):
+    if tokens[i] is not SYMBOL_TOKENS[']']:
       raise syntax_err
-    node.AddChild(SymbolNode(']'))
+    node.AddChild(SYMBOL_NODES[']'])
     i += 1
 
-  if tokens[i] != SymbolToken('='):
+  if tokens[i] is not SYMBOL_TOKENS['=']:
     raise syntax_err
-  node.AddChild(SymbolNode('='))
+  node.AddChild(SYMBOL_NODES['='])
   i += 1
 
   child, i = CompileExpression(tokens, i)
   node.AddChild(child)
 
-  if tokens[i] != SymbolToken(';'):
+  if tokens[i] is not SYMBOL_TOKENS[';']:
     raise syntax_err
-  node.AddChild(SymbolNode(';'))
+  node.AddChild(SYMBOL_NODES[';'])
   i += 1
 
   return node, i
@@ -620,14 +703,14 @@ def CompileDoStatement(
     tokens: List[Token], i: int) -> Tuple[DoStatementNode, int]:
   """Compile do statement tokens into a syntax subtree."""
   node = DoStatementNode()
-  node.AddChild(KeywordNode('do'))
+  node.AddChild(KEYWORD_NODES['do'])
   i += 1
   children, i = CompileSubroutineCall(tokens, i)
-  node.AddChildren(*children)
+  node.AddChildren(children)
 
-  if tokens[i] != SymbolToken(';'):
+  if tokens[i] is not SYMBOL_TOKENS[';']:
     raise SyntaxError('Expected ;')
-  node.AddChild(SymbolNode(';'))
+  node.AddChild(SYMBOL_NODES[';'])
   i += 1
 
   return node, i
@@ -637,16 +720,16 @@ def CompileReturnStatement(
     tokens: List[Token], i: int) -> Tuple[ReturnStatementNode, int]:
   """Compile return statement tokens into a syntax subtree."""
   node = ReturnStatementNode()
-  node.AddChild(KeywordNode('return'))
+  node.AddChild(KEYWORD_NODES['return'])
   i += 1
 
-  if tokens[i] != SymbolToken(';'):
+  if tokens[i] is not SYMBOL_TOKENS[';']:
     child, i = CompileExpression(tokens, i)
     node.AddChild(child)
 
-  if tokens[i] != SymbolToken(';'):
+  if tokens[i] is not SYMBOL_TOKENS[';']:
     raise SyntaxError('Expected ;')
-  node.AddChild(SymbolNode(';'))
+  node.AddChild(SYMBOL_NODES[';'])
   i += 1
 
   return node, i
@@ -655,14 +738,14 @@ def CompileReturnStatement(
 def CompileWhileStatement(tokens: List[Token], i: int) -> Tuple[WhileStatementNode, int]:
   """Compile while statement syntax subtree from tokens."""
   node = WhileStatementNode()
-  node.AddChild(KeywordNode('while'))
+  node.AddChild(KEYWORD_NODES['while'])
   i += 1
 
   children, i = CompileParenExpression(tokens, i)
-  node.AddChildren(*children)
+  node.AddChildren(children)
 
   children, i = CompileBlock(tokens, i)
-  node.AddChildren(*children)
+  node.AddChildren(children)
 
   return node, i
 
@@ -670,39 +753,50 @@ def CompileWhileStatement(tokens: List[Token], i: int) -> Tuple[WhileStatementNo
 def CompileIfStatement(tokens: List[Token], i: int) -> Tuple[IfStatementNode, int]:
   """Compile if statement subtree from list of tokens."""
   node = IfStatementNode()
-  node.AddChild(KeywordNode('if'))
+  node.AddChild(KEYWORD_NODES['if'])
   i += 1
 
   children, i = CompileParenExpression(tokens, i)
-  node.AddChildren(*children)
+  node.AddChildren(children)
 
   children, i = CompileBlock(tokens, i)
-  node.AddChildren(*children)
+  node.AddChildren(children)
 
-  if tokens[i] == KeywordToken('else'):
-    node.AddChild(KeywordNode('else'))
+  if tokens[i] is KEYWORD_TOKENS['else']:
+    node.AddChild(KEYWORD_NODES['else'])
     i += 1
     children, i = CompileBlock(tokens, i)
-    node.AddChildren(*children)
+    node.AddChildren(children)
 
   return node, i
 
 
+# Maps each statement keyword to its compiler, so CompileStatements does one
+# dict lookup per statement instead of a ladder of comparisons.
+STATEMENT_COMPILERS = {
+    'let': CompileLetStatement,
+    'do': CompileDoStatement,
+    'return': CompileReturnStatement,
+    'while': CompileWhileStatement,
+    'if': CompileIfStatement,
+}
+
+
 def CompileParenExpression(
     tokens: List[Token], i: int) -> Tuple[List[SyntaxTreeNode], int]:
   """Compile an expression wrapped in parentheses."""
   nodes = []
-  if tokens[i] != SymbolToken('('):
+  if tokens[i] is not SYMBOL_TOKENS['(']:
     raise SyntaxError('Expected (')
-  nodes.append(SymbolNode('('))
+  nodes.append(SYMBOL_NODES['('])
   i += 1
 
   child, i = CompileExpression(tokens, i)
   nodes.append(child)
 
-  if tokens[i] != SymbolToken(')'):
+  if tokens[i] is not SYMBOL_TOKENS[')']:
     raise SyntaxError('Expected )')
-  nodes.append(SymbolNode(')'))
+  nodes.append(SYMBOL_NODES[')'])
   i += 1
 
   return nodes, i
@@ -712,17 +806,17 @@ def CompileBlock(
     tokens: List[Token], i: int) -> Tuple[List[SyntaxTreeNode], int]:
   """Compile statements wrapped in curly braces, i.e. a block."""
   nodes = []
-  if tokens[i] != SymbolToken('{'):
+  if tokens[i] is not SYMBOL_TOKENS['{']:
     raise SyntaxError('Expected {')
-  nodes.append(SymbolNode('{'))
+  nodes.append(SYMBOL_NODES['{'])
   i += 1
 
   child, i = CompileStatements(tokens, i)
   nodes.append(child)
 
-  if tokens[i] != SymbolToken('}'):
+  if tokens[i] is not SYMBOL_TOKENS['}']:
     raise SyntaxError('Expected }')
-  nodes.append(SymbolNode('}'))
+  nodes.append(SYMBOL_NODES['}'])
   i += 1
 
   return nodes, i
@@ -734,8 +828,9 @@ def CompileExpression(
   node = ExpressionNode()
   child, i = CompileTerm(tokens, i)
   node.AddChild(child)
-  if any(tokens[i] == SymbolToken(symbol) for symbol in BINARY_OPS):
-    node.AddChild(SymbolNode(tokens[i].Value()))
+  token = tokens[i]
+  if token.kind == SYMBOL and token.value in BINARY_OPS:
+    node.AddChild(SYMBOL_NODES[tokens[i].value])
     i += 1
     child, i = CompileTerm(tokens, i)
     node.AddChild(child)
@@ -746,36 +841,36 @@ def CompileTerm(tokens: List[Token], i: int) -> Tuple[TermNode, int]:
   """Compile an expression term"""
   node = TermNode()
   syntax_err = SyntaxError('Invalid term')
-  if isinstance(tokens[i], IntegerConstantToken):
+  if tokens[i].kind == INTEGER_CONSTANT:
     node.AddChild(IntegerConstantNode(tokens[i].Value()))
     i += 1
-  elif isinstance(tokens[i], StringConstantToken):
+  elif tokens[i].kind == STRING_CONSTANT:
     node.AddChild(StringConstantNode(tokens[i].Value()))
     i += 1
-  elif any(tokens[i] == KeywordToken(kw) for kw in KEYWORD_CONSTANTS):
-    node.AddChild(KeywordNode(tokens[i].Value()))
+  elif tokens[i].kind == KEYWORD and tokens[i].value in KEYWORD_CONSTANTS:
+    node.AddChild(KEYWORD_NODES[tokens[i].value])
     i += 1
-  elif isinstance(tokens[i], IdentifierToken):
-    if tokens[i+1] == SymbolToken('(') or tokens[i+1] == SymbolToken('.'):
+  elif tokens[i].kind == IDENTIFIER:
+    if tokens[i+1] is SYMBOL_TOKENS['('] or tokens[i+1] is SYMBOL_TOKENS['.']:
       nodes, i = CompileSubroutineCall(tokens, i)
-      node.AddChildren(*nodes)
+      node.AddChildren(nodes)
     else:
       node.AddChild(IdentifierNode(tokens[i].Value()))
       i += 1
-      if tokens[i] == SymbolToken('['):
-        node.AddChild(SymbolNode('['))
+      if tokens[i] is SYMBOL_TOKENS['[']:
+        node.AddChild(SYMBOL_NODES['['])
         i += 1
         child, i = CompileExpression(tokens, i)
         node.AddChild(child)
-        if tokens[i] != SymbolToken(']'):
+        if tokens[i] is not SYMBOL_TOKENS[']']:
           raise syntax_err
-        node.AddChild(SymbolNode(']'))
+        node.AddChild(SYMBOL_NODES[']'])
         i += 1
-  elif tokens[i] == SymbolToken('('):
+  elif tokens[i] is SYMBOL_TOKENS['(']:
     children, i = CompileParenExpression(tokens, i)
-    node.AddChildren(*children)
-  elif any(tokens[i] == SymbolToken(symbol) for symbol in UNARY_OPS):
-    node.AddChild(SymbolNode(tokens[i].Value()))
+    node.AddChildren(children)
+  elif tokens[i].kind == SYMBOL and tokens[i].value in UNARY_OPS:
+    node.AddChild(SYMBOL_NODES[tokens[i].value])
     i += 1
     child, i = CompileTerm(tokens, i)
     node.AddChild(child)
@@ -791,62 +886,60 @@ def CompileSubroutineCall(
   syntax_err = SyntaxError('Invalid subroutine call')
   nodes.append(IdentifierNode(tokens[i].Value()))
   i += 1
-  if tokens[i] == SymbolToken('.'):
-    nodes.append(SymbolNode('.'))
+  if tokens[i] is SYMBOL_TOKENS['.']:
+    nodes.append(SYMBOL_NODES['.'])
     i += 1
-    if not isinstance(tokens[i], IdentifierToken):
+    if tokens[i].kind != IDENTIFIER:
       raise syntax_err
     nodes.append(IdentifierNode(tokens[i].Value()))
     i += 1
-  if tokens[i] != SymbolToken('('):
+  if tokens[i] is not SYMBOL_TOKENS['(']:
     raise syntax_err
-  nodes.append(SymbolNode('('))
+  nodes.append(SYMBOL_NODES['('])
   i += 1
   expression_list = ExpressionListNode()
-  while tokens[i] != SymbolToken(')'):
+  while tokens[i] is not SYMBOL_TOKENS[')']:
     child, i = CompileExpression(tokens, i)
     expression_list.AddChild(child)
-    if tokens[i] == SymbolToken(','):
-      expression_list.AddChild(SymbolNode(','))
+    if tokens[i] is SYMBOL_TOKENS[',']:
+      expression_list.AddChild(SYMBOL_NODES[','])
       i += 1
       continue
-    if tokens[i] == SymbolToken(')'):
+    if tokens[i] is SYMBOL_TOKENS[')']:
       break
     raise syntax_err
   nodes.append(expression_list)
-  nodes.append(SymbolNode(')'))
+  nodes.append(SYMBOL_NODES[')'])
   i += 1
   return nodes, i
 
 
-def SyntaxTreeToXML(node: SyntaxTreeNode) -> XMLTag:
-  """Convert a syntax tree into an XML tag tree."""
-  xml = XMLTag(node.TagName())
-  if isinstance(node, NonTerminalNode):
-    for child in node.children:
-      xml.AddChild(SyntaxTreeToXML(child), 2)
-  if isinstance(node, TerminalNode):
-    xml.Text(node.Value())
-  return xml
-
-
-def WriteSyntaxXML(jack_file_path: str, syntax_xml: XMLTag) -> str:
-  """Write the tokenized .jack file into a .xml file."""
+def WriteSyntaxXML(jack_file_path: str, syntax_tree: SyntaxTreeNode) -> str:
+  """Write the parsed .jack file's syntax tree into a .xml file."""
   out_dir, jack_filename = os.path.split(jack_file_path)
   out_path = os.path.join(out_dir, jack_filename.replace('.jack', '.xml'))
-  syntax_out = str(syntax_xml) + '\n'
-  with open(out_path, 'w') as f:
-    f.write(syntax_out)
+  with open(out_path, 'w', buffering=1 << 16) as f:
+    syntax_tree.WriteXML(f)
+
+
+def AnalyzeJackFile(file_path: str):
+  """Tokenize, parse, and write both XML outputs for one .jack file."""
+  print(f'Compiling {file_path}')
+  tokens = Tokenize(file_path)
+  WriteTokensXML(file_path, tokens)
+  WriteSyntaxXML(file_path, CompileClass(tokens))
 
 
 def main():
-  """Main function"""
-  for file_path in ParseJackFilePathsFromArguments():
-    print(f'Compiling {file_path}')
-    tokens = Tokenize(file_path)
-    WriteTokensXML(file_path, tokens)
-    syntax_tree = CompileClass(tokens)
-    WriteSyntaxXML(file_path, SyntaxTreeToXML(syntax_tree))
+  """Main function analyzes each .jack file on a pool of worker processes.
+
+  Files are fully independent, so the work is embarrassingly parallel;
+  processes rather than threads because the parse is CPU-bound Python.
+  """
+  file_paths = ParseJackFilePathsFromArguments()
+  with ProcessPoolExecutor() as executor:
+    # list() drains the iterator so worker exceptions propagate here.
+    list(executor.map(AnalyzeJackFile, file_paths))
 
 
 if __name__ == '__main__':
@@ -0,0 +1,23 @@
+"""
+Optional Cython build for the Jack Syntax Analyzer.
+
+The analyzer is plain Python and runs without this file. Building it with
+Cython in pure-python mode compiles the per-token hot paths (TokenizeBuffer
+and the recursive Compile* functions) to a C extension, which removes the
+bytecode dispatch overhead of the parser's per-token branching.
+
+Example usage:
+
+python setup.py build_ext --inplace
+
+"""
+
+from setuptools import setup
+
+from Cython.Build import cythonize
+
+
+setup(
+    name='JackAnalyzer',
+    ext_modules=cythonize('JackAnalyzer.py', language_level=3),
+)
@@ -12,11 +12,12 @@ program.
 """
 
 
+import io
 import os
 import sys
 
-from enum import Enum
-from typing import List
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Union
 
 from codeparser import (ClassNode, ClassVarDecNode, CompileClass,
                         DoStatementNode, ExpressionListNode, ExpressionNode,
@@ -30,6 +31,32 @@ from symboltable import SymbolTable, Variable, VariableKind, VariableType, Varia
 from tokenizer import InvalidInputError, Tokenize
 
 
+# Shared node instances for CodeWriter's equality checks. Comparing against
+# these avoids allocating a throwaway node per check during traversal.
+KW_CONSTRUCTOR = KeywordNode('constructor')
+KW_METHOD = KeywordNode('method')
+KW_STATIC = KeywordNode('static')
+SYM_DOT = SymbolNode('.')
+SYM_EQUALS = SymbolNode('=')
+SYM_LBRACKET = SymbolNode('[')
+SYM_LPAREN = SymbolNode('(')
+SYM_RPAREN = SymbolNode(')')
+SYM_SEMICOLON = SymbolNode(';')
+
+# Maps each binary op symbol to the VM command that implements it.
+BINARY_OP_COMMANDS = {
+    '+': 'add',
+    '-': 'sub',
+    '*': 'call Math.multiply 2',
+    '/': 'call Math.divide 2',
+    '&': 'and',
+    '|': 'or',
+    '<': 'lt',
+    '>': 'gt',
+    '=': 'eq',
+}
+
+
 def ParseJackFilePathsFromArguments() -> List[str]:
   """Parse command line arguments and return the paths to all the Jack files to analyze."""
   if len(sys.argv) != 2:
@@ -39,153 +66,170 @@ def ParseJackFilePathsFromArguments() -> List[str]:
     if not inp_path.endswith('.jack') or not os.path.exists(inp_path):
       raise InvalidInputError()
     return [inp_path]
-  jack_filenames = [fname for fname in os.listdir(inp_path)
-                          if fname.endswith('.jack')]
+  # scandir yields DirEntry objects with the name cached from one syscall
+  # sweep, unlike listdir + per-name stat on some filesystems.
+  with os.scandir(inp_path) as entries:
+    jack_filenames = [entry.name for entry in entries
+                      if entry.is_file() and entry.name.endswith('.jack')]
   if 'Main.jack' not in jack_filenames:
     raise InvalidInputError('Directory must contain a Main.jack file')
   return [os.path.join(inp_path, fname) for fname in jack_filenames]
 
 
-class VMSegment(Enum):
-  ARGUMENT = 'argument'
-  LOCAL = 'local'
-  THIS = 'this'
-  THAT = 'that'
-  CONSTANT = 'constant'
-  STATIC = 'static'
-  TEMP = 'temp'
-  POINTER = 'pointer'
-
-
-def VMSegmentFromKind(kind: VariableKind) -> VMSegment:
-  if kind == VariableKind.FIELD:
-    return VMSegment.THIS
-  if kind == VariableKind.STATIC:
-    return VMSegment.STATIC
-  if kind == VariableKind.LOCAL:
-    return VMSegment.LOCAL
-  else:  # kind == VariableKind.ARGUMENT:
-    return VMSegment.ARGUMENT
+# Maps each variable kind to the VM segment its values live in. Segments
+# are plain strings; the old VMSegment enum cost a descriptor lookup for
+# .value on every push and pop emitted.
+KIND_SEGMENTS = {
+    VariableKind.FIELD: 'this',
+    VariableKind.STATIC: 'static',
+    VariableKind.LOCAL: 'local',
+    VariableKind.ARGUMENT: 'argument',
+}
 
 
 class CodeWriter:
   """Class that handles parsing syntax tree and writing code."""
 
-  def __init__(self, syntax_tree: ClassNode):
-    self.output = []
+  def __init__(self, syntax_tree: ClassNode, out=None):
+    # Instructions go straight to out, typically the buffered .vm file
+    # handle, so the program is never held in memory twice. Without out a
+    # StringIO collects the code for the __str__ path.
+    self.output = out if out is not None else io.StringIO()
     self.cls_symbol_table = SymbolTable()
     self.subroutine_symbol_table = None
     self.cls_name = None
     self.subroutine_name = None
+    self.label_prefix = None
     self.subroutine_label_count = 0
 
+    # Per-node-type dispatch tables; one dict lookup replaces the
+    # isinstance chains in the statement and term traversals.
+    self.statement_dispatch = {
+        LetStatementNode: self.TranslateLetStatement,
+        DoStatementNode: self.TranslateDoStatement,
+        ReturnStatementNode: self.TranslateReturnStatement,
+        WhileStatementNode: self.TranslateWhileStatement,
+        IfStatementNode: self.TranslateIfStatement,
+    }
+    self.simple_term_dispatch = {
+        IntegerConstantNode: self.TranslateIntegerConstantTerm,
+        StringConstantNode: self.TranslateStringConstantTerm,
+        KeywordNode: self.TranslateKeywordConstantTerm,
+        IdentifierNode: self.TranslateVariableTerm,
+    }
+
     self.TranslateSyntaxTree(syntax_tree)
 
   def __str__(self):
-    """Write the output to the string content of a .vm file."""
-    result = '\n'.join(self.output)
-    if result:
-      result += '\n'
-    return result
+    """The translated VM code; only meaningful without an out stream."""
+    return self.output.getvalue()
 
-  def GetSymbol(self, name: str) -> Variable:
-    """Get a symbol from the symbol tables."""
+  def TryGetSymbol(self, name: str) -> Union[Variable, None]:
+    """Get a symbol from the symbol tables, or None if it is undefined."""
     result = self.subroutine_symbol_table.Get(name)
     if result is not None:
       return result
-    result = self.cls_symbol_table.Get(name)
+    return self.cls_symbol_table.Get(name)
+
+  def GetSymbol(self, name: str) -> Variable:
+    """Get a symbol from the symbol tables."""
+    result = self.TryGetSymbol(name)
     if result is None:
       raise SyntaxError(f'Undefined symbol {name}')
     return result
 
   def Write(self, *args):
     """Write new VM code instructions."""
-    self.output.extend(args)
+    self.output.write('\n'.join(args))
+    self.output.write('\n')
 
-  def WritePush(self, segment: VMSegment, index: int):
+  def WritePush(self, segment: str, index: int):
     """Write a stack push op."""
-    self.Write(f'push {segment.value} {index}')
+    self.output.write(f'push {segment} {index}\n')
 
-  def WritePop(self, segment: VMSegment, index: int):
+  def WritePop(self, segment: str, index: int):
     """Write a stack pop op."""
-    self.Write(f'pop {segment.value} {index}')
+    self.output.write(f'pop {segment} {index}\n')
 
   def WriteCall(self, cls_name: str, subroutine_name: str, n_args: int):
     """Write a function call op."""
-    self.Write(f'call {cls_name}.{subroutine_name} {n_args}')
+    self.output.write(f'call {cls_name}.{subroutine_name} {n_args}\n')
 
   def WriteLabel(self, label: str):
     """Writes a label VM command."""
-    self.Write(f'label {self.cls_name}.{self.subroutine_name}.{label}')
+    self.output.write(f'label {self.label_prefix}.{label}\n')
 
   def WriteGoto(self, label: str):
     """Writes a goto VM command."""
-    self.Write(f'goto {self.cls_name}.{self.subroutine_name}.{label}')
+    self.output.write(f'goto {self.label_prefix}.{label}\n')
 
   def WriteIfGoto(self, label: str):
     """Writes an if-goto VM command."""
-    self.Write(f'if-goto {self.cls_name}.{self.subroutine_name}.{label}')
+    self.output.write(f'if-goto {self.label_prefix}.{label}\n')
 
   def TranslateSyntaxTree(self, syntax_tree: ClassNode):
     """Translate a class syntax tree into VM code."""
     self.cls_name = syntax_tree.children[1].Value()
     for node in syntax_tree.children:
-      if isinstance(node, ClassVarDecNode):
+      if type(node) is ClassVarDecNode:
         self.AddClassSymbol(node)
         continue
-      if isinstance(node, SubroutineDecNode):
+      if type(node) is SubroutineDecNode:
         self.TranslateSubroutine(node)
   
   def AddClassSymbol(self, node: ClassVarDecNode):
     """Add a class variable to the symbol table."""
     kind = VariableKind.FIELD
-    if node.children[0] == KeywordNode('static'):
+    if node.children[0] == KW_STATIC:
       kind = VariableKind.STATIC
     var_type = VariableTypeFromNode(node.children[1])
     cls_name = None
     if var_type == VariableType.IDENTIFIER:
       cls_name = node.children[1].Value()
     for child in node.children[2:]:
-      if isinstance(child, IdentifierNode):
+      if type(child) is IdentifierNode:
         self.cls_symbol_table.Add(child.Value(), var_type, kind, cls_name)
 
   def TranslateSubroutine(self, node: SubroutineDecNode):
     """Translate a subroutine declaration into VM code."""
     self.subroutine_label_count = 0
     self.subroutine_name = node.children[2].Value()
+    # Every label in this subroutine shares the same qualified prefix, so
+    # format it once here instead of in each Write{Label,Goto,IfGoto}.
+    self.label_prefix = f'{self.cls_name}.{self.subroutine_name}'
     self.subroutine_symbol_table = SymbolTable()
 
     subroutine_body = node.children[6]
-    assert isinstance(subroutine_body, SubroutineBodyNode)
+    assert type(subroutine_body) is SubroutineBodyNode
     for child in subroutine_body.children:
-      if isinstance(child, VarDecNode):
+      if type(child) is VarDecNode:
         self.AddLocalVariableSymbol(child)
     n_vars = self.subroutine_symbol_table.GetNumberOfLocals()
 
-    self.Write(f'function {self.cls_name}.{self.subroutine_name} {n_vars}')
+    self.Write(f'function {self.label_prefix} {n_vars}')
 
-    if node.children[0] == KeywordNode('constructor'):
+    if node.children[0] == KW_CONSTRUCTOR:
       self.SetupConstructor()
 
-    is_method = node.children[0] == KeywordNode('method')
+    is_method = node.children[0] == KW_METHOD
     if is_method:
-      self.WritePush(VMSegment.ARGUMENT, 0)
-      self.WritePop(VMSegment.POINTER, 0)
+      self.WritePush('argument', 0)
+      self.WritePop('pointer', 0)
 
     parameter_list = node.children[4]
-    assert isinstance(parameter_list, ParameterListNode)
+    assert type(parameter_list) is ParameterListNode
     self.AddArgumentSymbols(parameter_list, is_method)
     
     for child in subroutine_body.children:
-      if isinstance(child, StatementsNode):
+      if type(child) is StatementsNode:
         self.TranslateStatements(child)
 
   def SetupConstructor(self):
     """Add setup code for a class constructor that allocates memory in the heap for the instance."""
     n_fields = self.cls_symbol_table.GetNumberOfFields()
-    self.WritePush(VMSegment.CONSTANT, n_fields)
+    self.WritePush('constant', n_fields)
     self.WriteCall('Memory', 'alloc', 1)
-    self.WritePop(VMSegment.POINTER, 0)
+    self.WritePop('pointer', 0)
 
   def AddArgumentSymbols(self, parameter_list: ParameterListNode, is_method: False):
     """Add argument symbols to the subroutine symbol table."""
@@ -208,84 +252,75 @@ class CodeWriter:
     if var_type == VariableType.IDENTIFIER:
       cls_name = var_dec.children[1].Value()
     for child in var_dec.children[2:]:
-      if isinstance(child, IdentifierNode):
+      if type(child) is IdentifierNode:
         self.subroutine_symbol_table.Add(
             child.Value(), var_type, VariableKind.LOCAL, cls_name)
 
   def TranslateStatements(self, node: StatementsNode):
     """Translate a statements node by looking at each child statement."""
+    dispatch = self.statement_dispatch
     for child in node.children:
-      if isinstance(child, LetStatementNode):
-        self.TranslateLetStatement(child)
-      elif isinstance(child, DoStatementNode):
-        self.TranslateDoStatement(child)
-      elif isinstance(child, ReturnStatementNode):
-        self.TranslateReturnStatement(child)
-      elif isinstance(child, WhileStatementNode):
-        self.TranslateWhileStatement(child)
-      else:
-        assert isinstance(child, IfStatementNode)
-        self.TranslateIfStatement(child)
+      dispatch[type(child)](child)
 
   def TranslateLetStatement(self, node: LetStatementNode):
     """Translate a let statement into VM instructions."""
     var_name = node.children[1].Value()
     var = self.GetSymbol(var_name)
-    if node.children[2] == SymbolNode('['):
-      self.WritePush(VMSegmentFromKind(var.kind), var.index)
+    if node.children[2] == SYM_LBRACKET:
+      self.WritePush(KIND_SEGMENTS[var.kind], var.index)
 
       expr1 = node.children[3]
-      assert isinstance(expr1, ExpressionNode)
+      assert type(expr1) is ExpressionNode
       self.TranslateExpression(expr1)
       expr2 = node.children[6]
-      assert isinstance(expr2, ExpressionNode)
+      assert type(expr2) is ExpressionNode
       self.TranslateExpression(expr2)
 
       # Write sum of array address and result of expression 2 to temp 0
-      self.WritePop(VMSegment.TEMP, 0)
-      self.WritePush(VMSegmentFromKind(var.kind), var.index)
+      self.WritePop('temp', 0)
+      self.WritePush(KIND_SEGMENTS[var.kind], var.index)
       self.Write('add')
       # Set `that` pointer to result of expression 1.
-      self.WritePop(VMSegment.POINTER, 1)
+      self.WritePop('pointer', 1)
 
       # Write the result expression 2 into the array.
-      self.WritePush(VMSegment.TEMP, 0)
-      self.WritePop(VMSegment.THAT, 0)
+      self.WritePush('temp', 0)
+      self.WritePop('that', 0)
       return
       
-    assert node.children[2] == SymbolNode('=')
+    assert node.children[2] == SYM_EQUALS
     expr = node.children[3]
-    assert isinstance(expr, ExpressionNode)
+    assert type(expr) is ExpressionNode
     self.TranslateExpression(expr)
-    self.WritePop(VMSegmentFromKind(var.kind), var.index)
+    self.WritePop(KIND_SEGMENTS[var.kind], var.index)
 
   def TranslateDoStatement(self, node: DoStatementNode):
     """Translate a do statement into VM instructions."""
     term = node.children[1]
-    assert isinstance(term, TermNode)
+    assert type(term) is TermNode
     self.TranslateSubroutineCall(term)
-    self.WritePop(VMSegment.TEMP, 0)
+    self.WritePop('temp', 0)
 
   def TranslateReturnStatement(self, node: ReturnStatementNode):
     """Translate a return statement into VM instructions."""
-    if isinstance(node.children[1], ExpressionNode):
+    if type(node.children[1]) is ExpressionNode:
       self.TranslateExpression(node.children[1])
     else:  # void function
-      assert node.children[1] == SymbolNode(';')
-      self.WritePush(VMSegment.CONSTANT, 0)
+      assert node.children[1] == SYM_SEMICOLON
+      self.WritePush('constant', 0)
     self.Write('return')
 
   def TranslateWhileStatement(self, node: WhileStatementNode):
     """Translate a while statement into VM instructions."""
     expr = node.children[2]
-    assert isinstance(expr, ExpressionNode)
+    assert type(expr) is ExpressionNode
 
     while_label1 = f'While.1.{self.subroutine_label_count}'
     while_label2 = f'While.2.{self.subroutine_label_count}'
     self.subroutine_label_count += 1
 
     statements = node.children[5]
-    assert isinstance(statements, StatementsNode)
+    assert type(statements) is StatementsNode
 
     self.WriteLabel(while_label1)
     self.TranslateExpression(expr)
@@ -298,16 +333,16 @@ class CodeWriter:
   def TranslateIfStatement(self, node: IfStatementNode):
     """Translate an if statement into VM instructions."""
     expr = node.children[2]
-    assert isinstance(expr, ExpressionNode)
+    assert type(expr) is ExpressionNode
 
     statements1 = node.children[5]
-    assert isinstance(statements1, StatementsNode)
+    assert type(statements1) is StatementsNode
 
     if len(node.children) == 7:  # No `else { ... }`
       statements2 = StatementsNode()
     else:
       statements2 = node.children[9]
-      assert isinstance(statements2, StatementsNode)
+      assert type(statements2) is StatementsNode
 
     if_label1 = f'If.1.{self.subroutine_label_count}'
     if_label2 = f'If.2.{self.subroutine_label_count}'
@@ -326,7 +361,7 @@ class CodeWriter:
     """Translate an expression into VM code."""
     if len(node.children) == 1:
       term = node.children[0]
-      assert isinstance(term, TermNode)
+      assert type(term) is TermNode
       self.TranslateTerm(term)
       return
     
@@ -334,10 +369,10 @@ class CodeWriter:
     op_stack = []
     for i, child in enumerate(node.children):
       if i % 2 == 0:
-        assert isinstance(child, TermNode)
+        assert type(child) is TermNode
         self.TranslateTerm(child)
       else:
-        assert isinstance(child, SymbolNode)
+        assert type(child) is SymbolNode
         op_stack.append(child)
     while op_stack:
       op = op_stack.pop()
@@ -350,10 +385,10 @@ class CodeWriter:
       self.TranslateSimpleTerm(node)
       return
 
-    if isinstance(node.children[0], SymbolNode):
+    if type(node.children[0]) is SymbolNode:
       child = node.children[0]
       if child.Value() in UNARY_OPS:
-        assert isinstance(node.children[1], TermNode)
+        assert type(node.children[1]) is TermNode
         self.TranslateTerm(node.children[1])
         
         if child.Value() == '-':
@@ -363,141 +398,142 @@ class CodeWriter:
           self.Write('not')
         return
       
-      assert child == SymbolNode('(')
-      assert len(node.children) == 3 and node.children[2] == SymbolNode(')')
+      assert child == SYM_LPAREN
+      assert len(node.children) == 3 and node.children[2] == SYM_RPAREN
       self.TranslateExpression(node.children[1])
       return
 
-    assert isinstance(node.children[0], IdentifierNode)
+    assert type(node.children[0]) is IdentifierNode
 
-    if (node.children[1] == SymbolNode('.')
-        or node.children[1] == SymbolNode('(')):
+    if (node.children[1] == SYM_DOT
+        or node.children[1] == SYM_LPAREN):
       self.TranslateSubroutineCall(node)
       return
 
     arr = node.children[0]
-    assert isinstance(arr, IdentifierNode)
+    assert type(arr) is IdentifierNode
     var = self.GetSymbol(arr.Value())
-    self.WritePush(VMSegmentFromKind(var.kind), var.index)
+    self.WritePush(KIND_SEGMENTS[var.kind], var.index)
 
-    assert node.children[1] == SymbolNode('[')
+    assert node.children[1] == SYM_LBRACKET
     expr = node.children[2]
-    assert isinstance(expr, ExpressionNode)
+    assert type(expr) is ExpressionNode
     self.TranslateExpression(expr)
     self.Write('add')
 
-    self.WritePop(VMSegment.POINTER, 1)
-    self.WritePush(VMSegment.THAT, 0)
+    self.WritePop('pointer', 1)
+    self.WritePush('that', 0)
 
   def TranslateSimpleTerm(self, node: TermNode):
     """Translate a `simple` term i.e. a term with only one child."""
     child = node.children[0]
-    if isinstance(child, IntegerConstantNode):
-      val = int(child.Value())
-      self.WritePush(VMSegment.CONSTANT, abs(val))
-      if val < 0:
-        self.Write('neg')
-    elif isinstance(child, StringConstantNode):
-      str_len = len(child.Value())
-      self.WritePush(VMSegment.CONSTANT, str_len)
-      self.WriteCall('String', 'new', 1)
-      for c in child.Value():
-        char = ord(c)
-        self.WritePush(VMSegment.CONSTANT, char)
-        # First parameter is the "this" pointer for the String instance.
-        self.WriteCall('String', 'appendChar', 2)
-    elif isinstance(child, KeywordNode):
-      kw = child.Value()
-      assert kw in KEYWORD_CONSTANTS
-      if kw == 'true':
-        self.WritePush(VMSegment.CONSTANT, 1)
-        self.Write('neg')
-      elif kw == 'false':
-        self.WritePush(VMSegment.CONSTANT, 0)
-      elif kw == 'null':
-        self.WritePush(VMSegment.CONSTANT, 0)
-      elif kw == 'this':
-        self.WritePush(VMSegment.POINTER, 0)
-    else:
-      assert isinstance(child, IdentifierNode)
-      var = self.GetSymbol(child.Value())
-      self.WritePush(VMSegmentFromKind(var.kind), var.index)
+    self.simple_term_dispatch[type(child)](child)
+
+  def TranslateIntegerConstantTerm(self, child: IntegerConstantNode):
+    """Translate an integer constant term into VM instructions."""
+    val = int(child.Value())
+    self.WritePush('constant', abs(val))
+    if val < 0:
+      self.Write('neg')
+
+  def TranslateStringConstantTerm(self, child: StringConstantNode):
+    """Translate a string constant term into VM instructions."""
+    value = child.Value()
+    self.WritePush('constant', len(value))
+    self.WriteCall('String', 'new', 1)
+    # Build the per-character instructions in one string so the constant
+    # costs a single write instead of two per character. The first
+    # appendChar parameter is the "this" pointer for the String instance.
+    self.output.write(''.join(
+        f'push constant {ord(c)}\ncall String.appendChar 2\n'
+        for c in value))
+
+  def TranslateKeywordConstantTerm(self, child: KeywordNode):
+    """Translate a keyword constant term into VM instructions."""
+    kw = child.Value()
+    assert kw in KEYWORD_CONSTANTS
+    if kw == 'true':
+      self.WritePush('constant', 1)
+      self.Write('neg')
+    elif kw == 'false':
+      self.WritePush('constant', 0)
+    elif kw == 'null':
+      self.WritePush('constant', 0)
+    elif kw == 'this':
+      self.WritePush('pointer', 0)
+
+  def TranslateVariableTerm(self, child: IdentifierNode):
+    """Translate a variable term into VM instructions."""
+    var = self.GetSymbol(child.Value())
+    self.WritePush(KIND_SEGMENTS[var.kind], var.index)
 
   def TranslateSubroutineCall(self, node: TermNode):
     """Translate a subroutine call into VM instructions."""
-    if node.children[1] == SymbolNode('.'):
-      try:
-        var_name = node.children[0].Value()
-        var = self.GetSymbol(var_name)
-        self.WritePush(VMSegmentFromKind(var.kind), var.index)
+    if node.children[1] == SYM_DOT:
+      var_name = node.children[0].Value()
+      var = self.TryGetSymbol(var_name)
+      if var is not None:
+        self.WritePush(KIND_SEGMENTS[var.kind], var.index)
         cls_name = var.cls_name
         n_method_args = 1
-      except SyntaxError:  # If lookup fails then must be a function call, not a method call.
-        cls_name = node.children[0].Value()
+      else:  # If lookup fails then must be a function call, not a method call.
+        cls_name = var_name
         n_method_args = 0
       subroutine_name = node.children[2].Value()
       expr_list = node.children[4]
-      assert isinstance(expr_list, ExpressionListNode)
+      assert type(expr_list) is ExpressionListNode
       n_args = self.TranslateExpressionList(expr_list)
       self.WriteCall(cls_name, subroutine_name, n_args + n_method_args)
 
-    if node.children[1] == SymbolNode('('):
+    if node.children[1] == SYM_LPAREN:
       subroutine_name = node.children[0].Value()
       expr_list = node.children[2]
-      assert isinstance(expr_list, ExpressionListNode)
-      self.WritePush(VMSegment.POINTER, 0)
+      assert type(expr_list) is ExpressionListNode
+      self.WritePush('pointer', 0)
       n_args = self.TranslateExpressionList(expr_list)
       self.WriteCall(self.cls_name, subroutine_name, n_args + 1)
 
   def TranslateExpressionList(self, node: ExpressionListNode) -> int:
     """Translate an expression list for a subroutine call."""
     n_args = 0
+    # Local binds keep the loop on LOAD_FAST instead of global and
+    # attribute lookups per argument.
+    expression_node = ExpressionNode
+    translate_expression = self.TranslateExpression
     for child in node.children:
-      if isinstance(child, ExpressionNode):
+      if type(child) is expression_node:
         n_args += 1
-        self.TranslateExpression(child)
+        translate_expression(child)
     return n_args
   
   def TranslateOp(self, node: SymbolNode):
     """Translate a binary op symbol to VM instructions."""
-    symbol = node.Value()
-    if symbol == '+':
-      self.Write('add')
-    elif symbol == '-':
-      self.Write('sub')
-    elif symbol == '*':
-      self.WriteCall('Math', 'multiply', 2)
-    elif symbol == '/':
-      self.WriteCall('Math', 'divide', 2)
-    elif symbol == '&':
-      self.Write('and')
-    elif symbol == '|':
-      self.Write('or')
-    elif symbol == '<':
-      self.Write('lt')
-    elif symbol == '>':
-      self.Write('gt')
-    else:
-      assert symbol == '='
-      self.Write('eq')
+    self.Write(BINARY_OP_COMMANDS[node.Value()])
 
 
-def WriteVMFile(jack_file_path: str, vm_file_content: str):
-  """Write the VM file content to the correct path."""
-  vm_file_path = jack_file_path.replace('.jack', '.vm')
-  with open(vm_file_path, 'w') as f:
-    f.write(vm_file_content)
+def CompileJackFile(jack_file: str):
+  """Compile one .jack file into its .vm file."""
+  print(f'Compiling {jack_file}...')
+  tokens = Tokenize(jack_file)
+  syntax_tree = CompileClass(tokens)
+  vm_file_path = jack_file.replace('.jack', '.vm')
+  with open(vm_file_path, 'w', buffering=1 << 16) as f:
+    CodeWriter(syntax_tree, f)
 
 
 def main():
-  """Main function called when you run the compiler."""
+  """Main function called when you run the compiler.
+
+  Each .jack file is an independent compilation unit, so multi-file
+  projects fan out over a pool of worker processes; a single file skips
+  the pool's startup cost."""
   jack_files = ParseJackFilePathsFromArguments()
-  for jack_file in jack_files:
-    print(f'Compiling {jack_file}...')
-    tokens = Tokenize(jack_file)
-    syntax_tree = CompileClass(tokens)
-    code_writer = CodeWriter(syntax_tree)
-    WriteVMFile(jack_file, str(code_writer))
+  if len(jack_files) == 1:
+    CompileJackFile(jack_files[0])
+    return
+  with ProcessPoolExecutor() as executor:
+    # list() drains the iterator so worker exceptions propagate here.
+    list(executor.map(CompileJackFile, jack_files))
 
 
 if __name__ == '__main__':
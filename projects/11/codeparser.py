@@ -11,36 +11,40 @@ and converts it into an abstract syntax tree which will be parsed for code writi
 
 from typing import List, Tuple
 
-from constants import BINARY_OPS, KEYWORD_CONSTANTS, UNARY_OPS
-from tokenizer import (IdentifierToken, IntegerConstantToken, InvalidInputError,
-                       KeywordToken, StringConstantToken, SymbolToken, Token)
+from constants import BINARY_OPS, KEYWORD_CONSTANTS, KEYWORDS, SYMBOLS, UNARY_OPS
+from tokenizer import (IDENTIFIER, INTEGER_CONSTANT, KEYWORD, KEYWORD_TOKENS,
+                       STRING_CONSTANT, SYMBOL, SYMBOL_TOKENS, IdentifierToken,
+                       IntegerConstantToken, InvalidInputError, KeywordToken,
+                       StringConstantToken, SymbolToken, Token)
 
 
 class SyntaxTreeNode:
   """Base class for a node in the abstract syntax tree."""
-  pass
+  __slots__ = ()
 
 
 class TerminalNode(SyntaxTreeNode):
-  pass
+  __slots__ = ()
 
 class KeywordNode(KeywordToken, TerminalNode):
-  pass
+  __slots__ = ()
 
 class SymbolNode(SymbolToken, TerminalNode):
-  pass
+  __slots__ = ()
 
 class IntegerConstantNode(IntegerConstantToken, TerminalNode):
-  pass
+  __slots__ = ()
 
 class StringConstantNode(StringConstantToken, TerminalNode):
-  pass
+  __slots__ = ()
 
 class IdentifierNode(IdentifierToken, TerminalNode):
-  pass
+  __slots__ = ()
 
 
 class NonTerminalNode(SyntaxTreeNode):
+  __slots__ = ('children',)
+
   def __init__(self):
     super(NonTerminalNode, self).__init__()
     self.children = []
@@ -49,93 +53,101 @@ class NonTerminalNode(SyntaxTreeNode):
     """Add a new child to the subtree."""
     self.children.append(child)
 
-  def AddChildren(self, *children: List[SyntaxTreeNode]):
+  def AddChildren(self, children: List[SyntaxTreeNode]):
     """Add a list of children to the subtree."""
     self.children.extend(children)
 
 class ClassNode(NonTerminalNode):
-  pass
+  __slots__ = ()
 
 class ClassVarDecNode(NonTerminalNode):
-  pass
+  __slots__ = ()
 
 class SubroutineDecNode(NonTerminalNode):
-  pass
+  __slots__ = ()
 
 class ParameterListNode(NonTerminalNode):
-  pass
+  __slots__ = ()
 
 class SubroutineBodyNode(NonTerminalNode):
-  pass
+  __slots__ = ()
 
 class VarDecNode(NonTerminalNode):
-  pass
+  __slots__ = ()
 
 class StatementsNode(NonTerminalNode):
-  pass
+  __slots__ = ()
 
 class LetStatementNode(NonTerminalNode):
-  pass
+  __slots__ = ()
 
 class DoStatementNode(NonTerminalNode):
-  pass
+  __slots__ = ()
 
 class ReturnStatementNode(NonTerminalNode):
-  pass
+  __slots__ = ()
 
 class WhileStatementNode(NonTerminalNode):
-  pass
+  __slots__ = ()
 
 class IfStatementNode(NonTerminalNode):
-  pass
+  __slots__ = ()
 
 class ExpressionNode(NonTerminalNode):
-  pass
+  __slots__ = ()
 
 class TermNode(NonTerminalNode):
-  pass
+  __slots__ = ()
 
 class ExpressionListNode(NonTerminalNode):
-  pass
+  __slots__ = ()
+
+
+# Canonical instances of every keyword and symbol node. Terminal nodes are
+# immutable, so every occurrence in the syntax tree can share one object
+# instead of the parser allocating a fresh node per use.
+KEYWORD_NODES = {keyword: KeywordNode(keyword) for keyword in KEYWORDS}
+SYMBOL_NODES = {symbol: SymbolNode(symbol) for symbol in SYMBOLS}
 
 
 def CompileClass(tokens: List[Token]) -> ClassNode:
   """Compile a class statement from tokens."""
-  if (tokens[0] != KeywordToken('class')
-      or (not isinstance(tokens[1], IdentifierToken))
-      or tokens[2] != SymbolToken('{')
-      or tokens[-1] != SymbolToken('}')):
+  if (tokens[0] != KEYWORD_TOKENS['class']
+      or tokens[1].kind != IDENTIFIER
+      or tokens[2] != SYMBOL_TOKENS['{']
+      or tokens[-1] != SYMBOL_TOKENS['}']):
     raise InvalidInputError('Invalid class')
   node = ClassNode()
   node.AddChildren(
-      KeywordNode('class'), IdentifierNode(tokens[1].Value()), SymbolNode('{'))
+      (KEYWORD_NODES['class'], IdentifierNode(tokens[1].value),
+       SYMBOL_NODES['{']))
 
-  tokens = tokens[3:-1]
-  nodes, i = CompileClassVarDecs(tokens)
-  node.AddChildren(*nodes)
+  # Walk the one token list by index; slicing it per section would copy
+  # the tail of the program for every class.
+  end = len(tokens) - 1
+  nodes, i = CompileClassVarDecs(tokens, 3, end)
+  node.AddChildren(nodes)
 
-  tokens = tokens[i:]
-  node.AddChildren(*CompileSubroutines(tokens))
+  node.AddChildren(CompileSubroutines(tokens, i, end))
 
-  node.AddChild(SymbolNode('}'))
+  node.AddChild(SYMBOL_NODES['}'])
   return node
 
 
 def CompileClassVarDecs(
-    tokens: List[Token]) -> Tuple[List[ClassVarDecNode], int]:
-  """Compile the class variable declarations."""
-  i = 0
+    tokens: List[Token], i: int, end: int) -> Tuple[List[ClassVarDecNode], int]:
+  """Compile the class variable declarations between the given indices."""
   nodes = []
-  while (tokens[i] == KeywordToken('static')
-         or tokens[i] == KeywordToken('field')):
+  while (tokens[i] == KEYWORD_TOKENS['static']
+         or tokens[i] == KEYWORD_TOKENS['field']):
     node = ClassVarDecNode()
-    node.AddChild(KeywordNode(tokens[i].Value()))
+    node.AddChild(KEYWORD_NODES[tokens[i].value])
     i += 1
     node.AddChild(ParseType(tokens[i]))
     i += 1
 
     children, i = ParseVarNames(tokens, i)
-    node.AddChildren(*children)
+    node.AddChildren(children)
 
     nodes.append(node)
   return nodes, i
@@ -146,72 +158,73 @@ def ParseVarNames(
   """Parse a single or multiple comma separated variable names of the same type."""
   nodes = []
   syntax_err = SyntaxError('Invalid variable name')
-  if not isinstance(tokens[i], IdentifierToken):
+  if tokens[i].kind != IDENTIFIER:
     raise syntax_err
-  nodes.append(IdentifierNode(tokens[i].Value()))
+  nodes.append(IdentifierNode(tokens[i].value))
   i += 1
 
-  while tokens[i] == SymbolToken(','):
-    nodes.append(SymbolNode(','))
+  while tokens[i] == SYMBOL_TOKENS[',']:
+    nodes.append(SYMBOL_NODES[','])
     i += 1
-    if not isinstance(tokens[i], IdentifierToken):
+    if tokens[i].kind != IDENTIFIER:
       raise syntax_err
-    nodes.append(IdentifierNode(tokens[i].Value()))
+    nodes.append(IdentifierNode(tokens[i].value))
     i += 1
 
-  if tokens[i] != SymbolToken(';'):
+  if tokens[i] != SYMBOL_TOKENS[';']:
     raise syntax_err
-  nodes.append(SymbolNode(';'))
+  nodes.append(SYMBOL_NODES[';'])
   i += 1
   return nodes, i
 
 
 def ParseType(token: Token):
   """Parse a token used to indicate a variable's type."""
-  if isinstance(token, KeywordToken):
-    return KeywordNode(token.Value())
-  if isinstance(token, IdentifierToken):
-    return IdentifierNode(token.Value())
+  if token.kind == KEYWORD:
+    return KEYWORD_NODES[token.value]
+  if token.kind == IDENTIFIER:
+    return IdentifierNode(token.value)
   raise SyntaxError('Invalid type')
 
 
-def CompileSubroutines(tokens: List[Token]) -> List[SubroutineDecNode]:
-  """Compile subroutine declarations"""
+def CompileSubroutines(
+    tokens: List[Token], i: int, end: int) -> List[SubroutineDecNode]:
+  """Compile subroutine declarations between the given indices"""
   nodes = []
-  i = 0
   syntax_err = SyntaxError('Invalid subroutine declaration')
-  while i < len(tokens):
+  while i < end:
     node = SubroutineDecNode()
 
-    if not (tokens[i] == KeywordToken('constructor')
-            or tokens[i] == KeywordToken('method')
-            or tokens[i] == KeywordToken('function')):
+    if not (tokens[i] == KEYWORD_TOKENS['constructor']
+            or tokens[i] == KEYWORD_TOKENS['method']
+            or tokens[i] == KEYWORD_TOKENS['function']):
       raise syntax_err
-    node.AddChild(KeywordNode(tokens[i].Value()))
+    node.AddChild(KEYWORD_NODES[tokens[i].value])
     i += 1
 
-    if tokens[i] == KeywordToken('void'):
-      node.AddChild(KeywordNode('void'))
+    if tokens[i] == KEYWORD_TOKENS['void']:
+      node.AddChild(KEYWORD_NODES['void'])
     else:
       node.AddChild(ParseType(tokens[i]))
     i += 1
 
-    if not isinstance(tokens[i], IdentifierToken):
+    if tokens[i].kind != IDENTIFIER:
       raise syntax_err
-    node.AddChild(IdentifierNode(tokens[i].Value()))
+    node.AddChild(IdentifierNode(tokens[i].value))
     i += 1
 
-    if tokens[i] != SymbolToken('('):
+    if tokens[i] != SYMBOL_TOKENS['(']:
       raise syntax_err
-    node.AddChild(SymbolNode('('))
+    node.AddChild(SYMBOL_NODES['('])
 
-    j = i + 1
-    while tokens[j] != SymbolToken(')') and j < len(tokens):
-      j += 1
-    if j == len(tokens):
+    # list.index runs the scan in C, and since the tokenizer interns
+    # symbol tokens the comparison short-circuits on identity.
+    try:
+      j = tokens.index(SYMBOL_TOKENS[')'], i + 1, end)
+    except ValueError:
       raise syntax_err
-    node.AddChild(ParseParameterList(tokens[i+1:j]))
-    node.AddChild(SymbolNode(')'))
+    node.AddChild(ParseParameterList(tokens, i + 1, j))
+    node.AddChild(SYMBOL_NODES[')'])
     i = j + 1
 
     child, i = CompileSubroutineBody(tokens, i)
@@ -221,23 +234,22 @@ def CompileSubroutines(tokens: List[Token]) -> List[SubroutineDecNode]:
   return nodes
 
 
-def ParseParameterList(tokens: List[Token]) -> ParameterListNode:
-  """Parse a parameter list from the given tokens for a subroutine declaration.
+def ParseParameterList(tokens: List[Token], i: int, end: int) -> ParameterListNode:
+  """Parse a parameter list for a subroutine declaration.
   
-  Tokens list should only contain tokens in the parameter list."""
+  The indices bound the tokens in the parameter list."""
   node = ParameterListNode()
-  i = 0
-  while i < len(tokens):
+  while i < end:
     node.AddChild(ParseType(tokens[i]))
     i += 1
 
-    if not isinstance(tokens[i], IdentifierToken):
+    if tokens[i].kind != IDENTIFIER:
       raise SyntaxError('Invalid parameter list')
-    node.AddChild(IdentifierNode(tokens[i].Value()))
+    node.AddChild(IdentifierNode(tokens[i].value))
     i += 1
 
-    if i < len(tokens) and tokens[i] == SymbolToken(','):
-      node.AddChild(SymbolNode(','))
+    if i < end and tokens[i] == SYMBOL_TOKENS[',']:
+      node.AddChild(SYMBOL_NODES[','])
       i += 1
   return node
 
@@ -247,20 +259,20 @@ def CompileSubroutineBody(
   """Compile the variable declarations and statements in the body of a subroutine."""
   node = SubroutineBodyNode()
 
-  if tokens[i] != SymbolToken('{'):
+  if tokens[i] != SYMBOL_TOKENS['{']:
     raise SyntaxError('Invalid subroutine body')
-  node.AddChild(SymbolNode('{'))
+  node.AddChild(SYMBOL_NODES['{'])
   i += 1
 
   nodes, i = CompileVarDecs(tokens, i)
-  node.AddChildren(*nodes)
+  node.AddChildren(nodes)
 
   child, i = CompileStatements(tokens, i)
   node.AddChild(child)
   
-  if tokens[i] != SymbolToken('}'):
+  if tokens[i] != SYMBOL_TOKENS['}']:
     raise SyntaxError('Invalid subroutine body')
-  node.AddChild(SymbolNode('}'))
+  node.AddChild(SYMBOL_NODES['}'])
   i += 1
 
   return node, i
@@ -270,16 +282,16 @@ def CompileVarDecs(
     tokens: List[Token], i: int) -> Tuple[List[VarDecNode], int]:
   """Compile the variable declarations in a subroutine body."""
   nodes = []
-  while tokens[i] == KeywordToken('var'):
+  while tokens[i] == KEYWORD_TOKENS['var']:
     node = VarDecNode()
-    node.AddChild(KeywordNode('var'))
+    node.AddChild(KEYWORD_NODES['var'])
     i += 1
 
     node.AddChild(ParseType(tokens[i]))
     i += 1
 
     children, i = ParseVarNames(tokens, i)
-    node.AddChildren(*children)
+    node.AddChildren(children)
 
     nodes.append(node)
   return nodes, i
@@ -289,28 +301,16 @@ def CompileStatements(
     tokens: List[Token], i: int) -> Tuple[StatementsNode, int]:
   """Compile the statements in a subroutine body."""
   node = StatementsNode()
-  while tokens[i] != SymbolToken('}'):
-    if tokens[i] == KeywordToken('let'):
-      child, i = CompileLetStatement(tokens, i)
-      node.AddChild(child)
-      continue
-    if tokens[i] == KeywordToken('do'):
-      child, i = CompileDoStatement(tokens, i)
-      node.AddChild(child)
-      continue
-    if tokens[i] == KeywordToken('return'):
-      child, i = CompileReturnStatement(tokens, i)
-      node.AddChild(child)
-      continue
-    if tokens[i] == KeywordToken('while'):
-      child, i = CompileWhileStatement(tokens, i)
-      node.AddChild(child)
-      continue
-    if tokens[i] == KeywordToken('if'):
-      child, i = CompileIfStatement(tokens, i)
-      node.AddChild(child)
-      continue
-    raise SyntaxError('Invalid statement')
+  while tokens[i] != SYMBOL_TOKENS['}']:
+    token = tokens[i]
+    if token.kind != KEYWORD:
+      raise SyntaxError('Invalid statement')
+    try:
+      compile_statement = STATEMENT_COMPILERS[token.value]
+    except KeyError:
+      raise SyntaxError('Invalid statement')
+    child, i = compile_statement(tokens, i)
+    node.AddChild(child)
   return node, i
 
 
@@ -318,36 +318,36 @@ def CompileLetStatement(
     tokens: List[Token], i: int) -> Tuple[LetStatementNode, int]:
   """Compile a let statement."""
   node = LetStatementNode()
-  node.AddChild(KeywordNode('let'))
+  node.AddChild(KEYWORD_NODES['let'])
   i += 1
 
   syntax_err = SyntaxError('Invalid let statement')
-  if not isinstance(tokens[i], IdentifierToken):
+  if tokens[i].kind != IDENTIFIER:
     raise syntax_err
-  node.AddChild(IdentifierNode(tokens[i].Value()))
+  node.AddChild(IdentifierNode(tokens[i].value))
   i += 1
 
-  if tokens[i] == SymbolToken('['):
-    node.AddChild(SymbolNode('['))
+  if tokens[i] == SYMBOL_TOKENS['[']:
+    node.AddChild(SYMBOL_NODES['['])
     i += 1
     child, i = CompileExpression(tokens, i)
     node.AddChild(child)
-    if tokens[i] != SymbolToken(']'):
+    if tokens[i] != SYMBOL_TOKENS[']']:
       raise syntax_err
-    node.AddChild(SymbolNode(']'))
+    node.AddChild(SYMBOL_NODES[']'])
     i += 1
 
-  if tokens[i] != SymbolToken('='):
+  if tokens[i] != SYMBOL_TOKENS['=']:
     raise syntax_err
-  node.AddChild(SymbolNode('='))
+  node.AddChild(SYMBOL_NODES['='])
   i += 1
 
   child, i = CompileExpression(tokens, i)
   node.AddChild(child)
 
-  if tokens[i] != SymbolToken(';'):
+  if tokens[i] != SYMBOL_TOKENS[';']:
     raise syntax_err
-  node.AddChild(SymbolNode(';'))
+  node.AddChild(SYMBOL_NODES[';'])
   i += 1
 
   return node, i
@@ -357,16 +357,16 @@ def CompileDoStatement(
     tokens: List[Token], i: int) -> Tuple[DoStatementNode, int]:
   """Compile do statement tokens into a syntax subtree."""
   node = DoStatementNode()
-  node.AddChild(KeywordNode('do'))
+  node.AddChild(KEYWORD_NODES['do'])
   i += 1
   child = TermNode()
   grandchildren, i = CompileSubroutineCall(tokens, i)
-  child.AddChildren(*grandchildren)
+  child.AddChildren(grandchildren)
   node.AddChild(child)
 
-  if tokens[i] != SymbolToken(';'):
+  if tokens[i] != SYMBOL_TOKENS[';']:
     raise SyntaxError('Expected ;')
-  node.AddChild(SymbolNode(';'))
+  node.AddChild(SYMBOL_NODES[';'])
   i += 1
 
   return node, i
@@ -376,16 +376,16 @@ def CompileReturnStatement(
     tokens: List[Token], i: int) -> Tuple[ReturnStatementNode, int]:
   """Compile return statement tokens into a syntax subtree."""
   node = ReturnStatementNode()
-  node.AddChild(KeywordNode('return'))
+  node.AddChild(KEYWORD_NODES['return'])
   i += 1
 
-  if tokens[i] != SymbolToken(';'):
+  if tokens[i] != SYMBOL_TOKENS[';']:
     child, i = CompileExpression(tokens, i)
     node.AddChild(child)
 
-  if tokens[i] != SymbolToken(';'):
+  if tokens[i] != SYMBOL_TOKENS[';']:
     raise SyntaxError('Expected ;')
-  node.AddChild(SymbolNode(';'))
+  node.AddChild(SYMBOL_NODES[';'])
   i += 1
 
   return node, i
@@ -394,14 +394,14 @@ def CompileReturnStatement(
 def CompileWhileStatement(tokens: List[Token], i: int) -> Tuple[WhileStatementNode, int]:
   """Compile while statement syntax subtree from tokens."""
   node = WhileStatementNode()
-  node.AddChild(KeywordNode('while'))
+  node.AddChild(KEYWORD_NODES['while'])
   i += 1
 
   children, i = CompileParenExpression(tokens, i)
-  node.AddChildren(*children)
+  node.AddChildren(children)
 
   children, i = CompileBlock(tokens, i)
-  node.AddChildren(*children)
+  node.AddChildren(children)
 
   return node, i
 
@@ -409,39 +409,51 @@ def CompileWhileStatement(tokens: List[Token], i: int) -> Tuple[WhileStatementNo
 def CompileIfStatement(tokens: List[Token], i: int) -> Tuple[IfStatementNode, int]:
   """Compile if statement subtree from list of tokens."""
   node = IfStatementNode()
-  node.AddChild(KeywordNode('if'))
+  node.AddChild(KEYWORD_NODES['if'])
   i += 1
 
   children, i = CompileParenExpression(tokens, i)
-  node.AddChildren(*children)
+  node.AddChildren(children)
 
   children, i = CompileBlock(tokens, i)
-  node.AddChildren(*children)
+  node.AddChildren(children)
 
-  if tokens[i] == KeywordToken('else'):
-    node.AddChild(KeywordNode('else'))
+  if tokens[i] == KEYWORD_TOKENS['else']:
+    node.AddChild(KEYWORD_NODES['else'])
     i += 1
     children, i = CompileBlock(tokens, i)
-    node.AddChildren(*children)
+    node.AddChildren(children)
 
   return node, i
 
 
+# Maps each statement keyword to its compile function so CompileStatements
+# dispatches with one dict lookup instead of walking an if chain per
+# statement. Defined here since the compile functions must exist first.
+STATEMENT_COMPILERS = {
+    'let': CompileLetStatement,
+    'do': CompileDoStatement,
+    'return': CompileReturnStatement,
+    'while': CompileWhileStatement,
+    'if': CompileIfStatement,
+}
+
+
 def CompileParenExpression(
     tokens: List[Token], i: int) -> Tuple[List[SyntaxTreeNode], int]:
   """Compile an expression wrapped in parentheses."""
   nodes = []
-  if tokens[i] != SymbolToken('('):
+  if tokens[i] != SYMBOL_TOKENS['(']:
     raise SyntaxError('Expected (')
-  nodes.append(SymbolNode('('))
+  nodes.append(SYMBOL_NODES['('])
   i += 1
 
   child, i = CompileExpression(tokens, i)
   nodes.append(child)
 
-  if tokens[i] != SymbolToken(')'):
+  if tokens[i] != SYMBOL_TOKENS[')']:
     raise SyntaxError('Expected )')
-  nodes.append(SymbolNode(')'))
+  nodes.append(SYMBOL_NODES[')'])
   i += 1
 
   return nodes, i
@@ -451,17 +463,17 @@ def CompileBlock(
     tokens: List[Token], i: int) -> Tuple[List[SyntaxTreeNode], int]:
   """Compile statements wrapped in curly braces, i.e. a block."""
   nodes = []
-  if tokens[i] != SymbolToken('{'):
+  if tokens[i] != SYMBOL_TOKENS['{']:
     raise SyntaxError('Expected {')
-  nodes.append(SymbolNode('{'))
+  nodes.append(SYMBOL_NODES['{'])
   i += 1
 
   child, i = CompileStatements(tokens, i)
   nodes.append(child)
 
-  if tokens[i] != SymbolToken('}'):
+  if tokens[i] != SYMBOL_TOKENS['}']:
     raise SyntaxError('Expected }')
-  nodes.append(SymbolNode('}'))
+  nodes.append(SYMBOL_NODES['}'])
   i += 1
 
   return nodes, i
@@ -473,8 +485,8 @@ def CompileExpression(
   node = ExpressionNode()
   child, i = CompileTerm(tokens, i)
   node.AddChild(child)
-  while any(tokens[i] == SymbolToken(symbol) for symbol in BINARY_OPS):
-    node.AddChild(SymbolNode(tokens[i].Value()))
+  while tokens[i].kind == SYMBOL and tokens[i].value in BINARY_OPS:
+    node.AddChild(SYMBOL_NODES[tokens[i].value])
     i += 1
     child, i = CompileTerm(tokens, i)
     node.AddChild(child)
@@ -485,36 +497,36 @@ def CompileTerm(tokens: List[Token], i: int) -> Tuple[TermNode, int]:
   """Compile an expression term"""
   node = TermNode()
   syntax_err = SyntaxError('Invalid term')
-  if isinstance(tokens[i], IntegerConstantToken):
-    node.AddChild(IntegerConstantNode(tokens[i].Value()))
+  if tokens[i].kind == INTEGER_CONSTANT:
+    node.AddChild(IntegerConstantNode(tokens[i].value))
     i += 1
-  elif isinstance(tokens[i], StringConstantToken):
-    node.AddChild(StringConstantNode(tokens[i].Value()))
+  elif tokens[i].kind == STRING_CONSTANT:
+    node.AddChild(StringConstantNode(tokens[i].value))
     i += 1
-  elif any(tokens[i] == KeywordToken(kw) for kw in KEYWORD_CONSTANTS):
-    node.AddChild(KeywordNode(tokens[i].Value()))
+  elif tokens[i].kind == KEYWORD and tokens[i].value in KEYWORD_CONSTANTS:
+    node.AddChild(KEYWORD_NODES[tokens[i].value])
     i += 1
-  elif isinstance(tokens[i], IdentifierToken):
-    if tokens[i+1] == SymbolToken('(') or tokens[i+1] == SymbolToken('.'):
+  elif tokens[i].kind == IDENTIFIER:
+    if tokens[i+1] == SYMBOL_TOKENS['('] or tokens[i+1] == SYMBOL_TOKENS['.']:
       nodes, i = CompileSubroutineCall(tokens, i)
-      node.AddChildren(*nodes)
+      node.AddChildren(nodes)
     else:
-      node.AddChild(IdentifierNode(tokens[i].Value()))
+      node.AddChild(IdentifierNode(tokens[i].value))
       i += 1
-      if tokens[i] == SymbolToken('['):
-        node.AddChild(SymbolNode('['))
+      if tokens[i] == SYMBOL_TOKENS['[']:
+        node.AddChild(SYMBOL_NODES['['])
         i += 1
         child, i = CompileExpression(tokens, i)
         node.AddChild(child)
-        if tokens[i] != SymbolToken(']'):
+        if tokens[i] != SYMBOL_TOKENS[']']:
           raise syntax_err
-        node.AddChild(SymbolNode(']'))
+        node.AddChild(SYMBOL_NODES[']'])
         i += 1
-  elif tokens[i] == SymbolToken('('):
+  elif tokens[i] == SYMBOL_TOKENS['(']:
     children, i = CompileParenExpression(tokens, i)
-    node.AddChildren(*children)
-  elif any(tokens[i] == SymbolToken(symbol) for symbol in UNARY_OPS):
-    node.AddChild(SymbolNode(tokens[i].Value()))
+    node.AddChildren(children)
+  elif tokens[i].kind == SYMBOL and tokens[i].value in UNARY_OPS:
+    node.AddChild(SYMBOL_NODES[tokens[i].value])
     i += 1
     child, i = CompileTerm(tokens, i)
     node.AddChild(child)
@@ -528,32 +540,32 @@ def CompileSubroutineCall(
   """Compile a subroutine call."""
   nodes = []
   syntax_err = SyntaxError('Invalid subroutine call')
-  nodes.append(IdentifierNode(tokens[i].Value()))
+  nodes.append(IdentifierNode(tokens[i].value))
   i += 1
-  if tokens[i] == SymbolToken('.'):
-    nodes.append(SymbolNode('.'))
+  if tokens[i] == SYMBOL_TOKENS['.']:
+    nodes.append(SYMBOL_NODES['.'])
     i += 1
-    if not isinstance(tokens[i], IdentifierToken):
+    if tokens[i].kind != IDENTIFIER:
       raise syntax_err
-    nodes.append(IdentifierNode(tokens[i].Value()))
+    nodes.append(IdentifierNode(tokens[i].value))
     i += 1
-  if tokens[i] != SymbolToken('('):
+  if tokens[i] != SYMBOL_TOKENS['(']:
     raise syntax_err
-  nodes.append(SymbolNode('('))
+  nodes.append(SYMBOL_NODES['('])
   i += 1
   expression_list = ExpressionListNode()
-  while tokens[i] != SymbolToken(')'):
+  while tokens[i] != SYMBOL_TOKENS[')']:
     child, i = CompileExpression(tokens, i)
     expression_list.AddChild(child)
-    if tokens[i] == SymbolToken(','):
-      expression_list.AddChild(SymbolNode(','))
+    if tokens[i] == SYMBOL_TOKENS[',']:
+      expression_list.AddChild(SYMBOL_NODES[','])
       i += 1
       continue
-    if tokens[i] == SymbolToken(')'):
+    if tokens[i] == SYMBOL_TOKENS[')']:
       break
     raise syntax_err
   nodes.append(expression_list)
-  nodes.append(SymbolNode(')'))
+  nodes.append(SYMBOL_NODES[')'])
   i += 1
   return nodes, i
 
@@ -8,17 +8,20 @@ This file contains constants used throughout the compiler.
 """
 
 
-KEYWORDS = {'class', 'constructor', 'function', 'method', 'field', 'static',
-            'var', 'int', 'char', 'boolean', 'bool', 'void', 'true', 'false',
-            'null', 'this', 'let', 'do', 'if', 'else', 'while', 'return'}
+# All frozen: the sets never change after import, and frozenset membership
+# skips the mutability checks of a plain set.
+KEYWORDS = frozenset({
+    'class', 'constructor', 'function', 'method', 'field', 'static',
+    'var', 'int', 'char', 'boolean', 'bool', 'void', 'true', 'false',
+    'null', 'this', 'let', 'do', 'if', 'else', 'while', 'return'})
 
-SYMBOLS = {'{', '}', '(', ')', '[', ']', '.', ',', ';', '+', '-', '*', '/',
-           '&', '|', '<', '>', '=', '~'}
+SYMBOLS = frozenset({'{', '}', '(', ')', '[', ']', '.', ',', ';', '+', '-',
+                     '*', '/', '&', '|', '<', '>', '=', '~'})
 
-WHITESPACE = {' ', '\t', '\r'}
+WHITESPACE = frozenset({' ', '\t', '\r'})
 
-BINARY_OPS = {'+', '-', '*', '/', '&', '|', '<', '>', '='}
+BINARY_OPS = frozenset({'+', '-', '*', '/', '&', '|', '<', '>', '='})
 
-UNARY_OPS = {'-', '~'}
+UNARY_OPS = frozenset({'-', '~'})
 
-KEYWORD_CONSTANTS = {'true', 'false', 'null', 'this'}
+KEYWORD_CONSTANTS = frozenset({'true', 'false', 'null', 'this'})
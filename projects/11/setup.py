@@ -0,0 +1,25 @@
+"""
+Jack Compiler
+=============
+Optional Cython build
+---------------------
+The compiler is plain Python and runs without this file. Building the
+tokenizer and parser with Cython in pure-python mode compiles the token
+scan and the recursive-descent Compile* loops to C extensions, removing
+the interpreter dispatch on the hottest parts of the pipeline.
+
+Example usage:
+
+python setup.py build_ext --inplace
+
+"""
+
+from setuptools import setup
+
+from Cython.Build import cythonize
+
+
+setup(
+    name='JackCompiler',
+    ext_modules=cythonize(['tokenizer.py', 'codeparser.py'], language_level=3),
+)
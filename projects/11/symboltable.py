@@ -15,6 +15,13 @@ from typing import NamedTuple, Union
 from codeparser import IdentifierNode, KeywordNode, TerminalNode
 
 
+# Shared node instances for the type checks in VariableTypeFromNode.
+KW_INT = KeywordNode('int')
+KW_CHAR = KeywordNode('char')
+KW_BOOLEAN = KeywordNode('boolean')
+KW_BOOL = KeywordNode('bool')
+
+
 class VariableType(Enum):
   """Different variable types in Jack."""
   INT = 'int'
@@ -25,11 +32,11 @@ class VariableType(Enum):
 
 def VariableTypeFromNode(node: TerminalNode):
   """Get the VariableType from a TerminalNode in the syntax tree."""
-  if node == KeywordNode('int'):
+  if node == KW_INT:
     return VariableType.INT
-  if node == KeywordNode('char'):
+  if node == KW_CHAR:
     return VariableType.CHAR
-  if node == KeywordNode('boolean') or node == KeywordNode('bool'):
+  if node == KW_BOOLEAN or node == KW_BOOL:
     return VariableType.BOOL
   if isinstance(node, IdentifierNode):
     return VariableType.IDENTIFIER
@@ -80,12 +87,11 @@ class SymbolTable:
     return self.symbols[name]
 
   def GetNumberOfKind(self, kind: VariableKind):
-    """Get the number of variables with a given kind."""
-    result = 0
-    for symbol in self.symbols.values():
-      if symbol.kind == kind:
-        result += 1
-    return result
+    """Get the number of variables with a given kind.
+
+    cur_indices already counts each kind as symbols are added, so this
+    is a dict read instead of a scan over the whole table."""
+    return self.cur_indices[kind]
 
   def GetNumberOfFields(self):
     """Get the number of class fields in the symbol table."""
@@ -9,10 +9,11 @@ This was originally implemented in project 10.
 """
 
 import os
+import re
 
 from typing import List
 
-from constants import KEYWORDS, SYMBOLS, WHITESPACE
+from constants import KEYWORDS, SYMBOLS
 
 
 class InvalidInputError(Exception):
@@ -24,44 +25,80 @@ class InvalidInputError(Exception):
                         'path/to/input/dir/')
 
 
+# Integer codes for each kind of token. Comparing small ints is cheaper
+# than an isinstance call, and the codes stay valid on the node classes
+# that subclass the tokens in codeparser.
+KEYWORD, SYMBOL, INTEGER_CONSTANT, STRING_CONSTANT, IDENTIFIER = range(5)
+
+
 class Token(object):
   """Base token class, all other tokens inherit from this class."""
+  __slots__ = ('value',)
+  kind = -1
+
   def __init__(self, value):
     self.value = value
 
   def __eq__(self, other) -> bool:
-    return ((self.__class__, self.value) ==
-            (other.__class__, other.value))
+    # With interned keyword and symbol tokens most comparisons are
+    # between the same object, so check identity before the fields.
+    return self is other or (
+        self.kind == other.kind and self.value == other.value)
 
   def Value(self) -> str:
     """Value property formatted for XML"""
     return self.value
 
 class KeywordToken(Token):
-  pass
+  __slots__ = ()
+  kind = KEYWORD
 
 class SymbolToken(Token):
-  pass
+  __slots__ = ()
+  kind = SYMBOL
 
 class IntegerConstantToken(Token):
-  pass
+  __slots__ = ()
+  kind = INTEGER_CONSTANT
 
 class StringConstantToken(Token):
-  pass
+  __slots__ = ()
+  kind = STRING_CONSTANT
 
 class IdentifierToken(Token):
-  pass
+  __slots__ = ()
+  kind = IDENTIFIER
+
+
+# Canonical instances of every keyword and symbol token. Tokens are
+# immutable, so each occurrence in the source can share one object instead
+# of allocating a fresh token per use.
+KEYWORD_TOKENS = {keyword: KeywordToken(keyword) for keyword in KEYWORDS}
+SYMBOL_TOKENS = {symbol: SymbolToken(symbol) for symbol in SYMBOLS}
+
+# Matches one Jack token per match: a string constant, a symbol, a run of
+# word characters starting with a digit (a valid integer constant or a
+# malformed identifier), or an identifier/keyword. Comments match the
+# groupless alternatives and whitespace matches nothing, so both are
+# skipped implicitly; a bare '/*' or '"' only matches when a multiline
+# comment or a string never terminates. The whole source is scanned
+# exactly once.
+JACK_TOKEN_RE = re.compile(
+    r'/\*[\s\S]*?\*/'
+    r'|/\*'
+    r'|//[^\n]*'
+    r'|"([^"\n]*)"'
+    r'|([{}()\[\].,;+\-*/&|<>=~])'
+    r'|(\d\w*)'
+    r'|([A-Za-z_]\w*)'
+    r'|"')
 
 
 def Tokenize(jack_file_path: str) -> List[Token]:
   """Tokenize the content of a .jack file path."""
   with open(jack_file_path, 'r') as f:
     jack_file_content = f.read()
-  jack_file_content = RemoveMultilineComments(jack_file_content)
-  jack_file_lines = RemoveSingleLineComments(jack_file_content.split('\n'))
-  tokens = []
-  for line in jack_file_lines:
-    tokens.extend(TokenizeLine(line))
+  tokens = TokenizeBuffer(jack_file_content)
   if tokens[0] != KeywordToken('class'):
     raise SyntaxError('Expected class')
   if tokens[-1] != SymbolToken('}'):
@@ -69,90 +106,39 @@ def Tokenize(jack_file_path: str) -> List[Token]:
   return tokens
 
 
-def RemoveMultilineComments(jack_file_content: str) -> str:
-  """Strips away any multiline comments from the .jack file."""
-  result = []
-  while True:
-    try:
-      idx = jack_file_content.index('/*')
-      result.append(jack_file_content[:idx])
-    except ValueError:
-      result.append(jack_file_content)
-      break
-    try:
-      jack_file_content = jack_file_content[idx+2:]
-      idx = jack_file_content.index('*/')
-      jack_file_content = jack_file_content[idx+2:]
-    except ValueError:
-      raise SyntaxError('Expected */ before end of file')
-  return ''.join(result)
-
-
-def RemoveSingleLineComments(jack_file_lines: List[str]) -> List[str]:
-  """Remove any single line comments and empty lines."""
-  result = []
-  for line in jack_file_lines:
-    try:
-      line = line[:line.index('//')]
-      if line:
-        result.append(line)
-    except ValueError:
-      result.append(line)
-  return result
-
-
-def TokenizeLine(line: str) -> List[Token]:
-  """Tokenize a line of Jack code. Always non-empty."""
-  i = 0
-  cur = ''
+def TokenizeBuffer(jack_file_content: str) -> List[Token]:
+  """Tokenize Jack code with a single pass of the token regex.
+
+  The C regex engine runs the character-level inner loop, so the Python
+  level only classifies one match per token. Comments are consumed by
+  the groupless alternatives of the pattern, so there is no separate
+  stripping pass or intermediate stripped buffer."""
   tokens = []
-  while i < len(line):
-    if line[i] in WHITESPACE:
-      if cur:
-        tokens.append(TokenizeString(cur))
-        cur = ''
-      i += 1
-      continue
-    if line[i] in SYMBOLS:
-      if cur:
-        tokens.append(TokenizeString(cur))
-        cur = ''
-      tokens.append(SymbolToken(line[i]))
-      i += 1
-      continue
-    if line[i] == '"':
-      if cur:
-        raise SyntaxError('Unexpected characters before string')
-      try:
-        j = line[i+1:].index('"')
-      except ValueError:
-        raise SyntaxError('Expected string to end before line ends')
-      tokens.append(StringConstantToken(line[i+1:i+1+j]))
-      i += j + 2
-      continue
-    cur += line[i]
-    i += 1
+  tokens_append = tokens.append
+  for match in JACK_TOKEN_RE.finditer(jack_file_content):
+    string, symbol, number, word = match.groups()
+    if word is not None:
+      tokens_append(
+          KEYWORD_TOKENS[word] if word in KEYWORDS else IdentifierToken(word))
+    elif symbol is not None:
+      tokens_append(SYMBOL_TOKENS[symbol])
+    elif number is not None:
+      if not number.isdigit():
+        raise SyntaxError('Identifiers cannot start with numbers')
+      tokens_append(IntegerConstantToken(int(number)))
+    elif string is not None:
+      tokens_append(StringConstantToken(string))
+    elif match.group(0) == '/*':
+      # Only an unterminated multiline comment matches the bare '/*'
+      # alternative; a terminated one consumes through its '*/'.
+      raise SyntaxError('Expected */ before end of file')
+    elif match.group(0) == '"':
+      # Likewise a complete string consumes its closing quote, so a
+      # bare '"' only matches when the string never ends on its line.
+      raise SyntaxError('Expected string to end before line ends')
   return tokens
 
 
-def TokenizeString(value: str) -> Token:
-  """Tokenize the given string"""
-  if not value:
-    raise InvalidInputError('Expected non-empty string')
-  if value in KEYWORDS:
-    return KeywordToken(value)
-  try:
-    return IntegerConstantToken(int(value))
-  except ValueError:
-    pass
-  try:
-    int(value[0])
-    raise SyntaxError('Identifiers cannot start with numbers')
-  except ValueError:
-    pass
-  return IdentifierToken(value)
-
-
 def TestTokenizer():
   example_jack_content = """
   class Main {